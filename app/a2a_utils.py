@@ -0,0 +1,49 @@
+"""A2A server helpers shared by the green and white agent servers."""
+
+from typing import Any, Dict, Optional
+
+import orjson
+from a2a.server.apps import A2AStarletteApplication
+from a2a.utils.constants import PREV_AGENT_CARD_WELL_KNOWN_PATH
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def dumps_text(payload: Dict[str, Any]) -> str:
+    """Serialize a task result for an A2A text part."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def parse_task_data(parts) -> Optional[Dict[str, Any]]:
+    """Decode the JSON task object carried by a message's text parts."""
+    # The payload is normally the first text part, so this returns on the first
+    # iteration; other parts are only tried if that one isn't a JSON object.
+    for part in parts:
+        # Parts are either Part wrappers (with .root) or bare TextPart objects
+        text = getattr(getattr(part, 'root', part), 'text', None)
+        if text is None:
+            continue
+        try:
+            task_data = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            continue
+        if isinstance(task_data, dict):
+            return task_data
+    return None
+
+
+class CachedAgentCardApplication(A2AStarletteApplication):
+    """A2A Starlette app that serves the static agent card from pre-serialized bytes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._agent_card_bytes = orjson.dumps(
+            self.agent_card.model_dump(mode="json", exclude_none=True, by_alias=True)
+        )
+
+    async def _handle_get_agent_card(self, request: Request) -> Response:
+        """Serve the agent card without re-dumping the pydantic model per request."""
+        # The base handler applies card_modifier and warns about the deprecated path
+        if self.card_modifier or request.url.path == PREV_AGENT_CARD_WELL_KNOWN_PATH:
+            return await super()._handle_get_agent_card(request)
+        return Response(self._agent_card_bytes, media_type="application/json")
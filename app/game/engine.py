@@ -1,5 +1,6 @@
 """Main game engine for Werewolf Benchmark"""
 
+import random
 import uuid
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -23,9 +24,10 @@ class GameEngine:
     def create_game(
         self,
         agent_urls: List[str],
-        config: Optional[GameConfig] = None
+        config: Optional[GameConfig] = None,
+        rng: Optional[random.Random] = None
     ) -> GameState:
-        """Create a new game with the specified agents."""
+        """Create a new game with the specified agents, drawing roles from rng if given."""
         if len(agent_urls) < 8:
             raise ValueError("Minimum 8 agents required to play Werewolf with all roles (2 werewolves, 1 seer, 1 doctor, 1 hunter, 1 witch, 2 villagers)")
 
@@ -43,7 +45,8 @@ class GameEngine:
 
         game_state.role_assignments = self.state_manager.assign_roles(
             agent_ids,
-            game_state.config.model_dump()
+            game_state.config.model_dump(),
+            rng=rng
         )
 
         logger.info(f"Created game {game_id} with {len(agent_urls)} agents")
@@ -107,7 +110,8 @@ class GameEngine:
     def advance_phase(
         self,
         game_state: GameState,
-        phase_actions: List[WerewolfAction]
+        phase_actions: List[WerewolfAction],
+        rng: Optional[random.Random] = None
     ) -> tuple[GameState, List[str]]:
         """
         Advance game to the next phase and process phase results.
@@ -115,6 +119,7 @@ class GameEngine:
         Args:
             game_state: Current game state
             phase_actions: All actions from the current phase
+            rng: Game random source used to break vote ties
 
         Returns:
             Tuple of (updated game state, list of eliminated agent IDs)
@@ -123,7 +128,7 @@ class GameEngine:
 
         # Process phase-specific outcomes
         if game_state.phase == GamePhase.DAY_VOTING:
-            eliminated_id = self.state_manager.process_voting_results(game_state)
+            eliminated_id = self.state_manager.process_voting_results(game_state, rng=rng)
             if eliminated_id:
                 self.state_manager.eliminate_agent(game_state, eliminated_id)
                 eliminated.append(eliminated_id)
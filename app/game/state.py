@@ -11,8 +11,12 @@ class StateManager:
     """Manages game state transitions and updates"""
 
     @staticmethod
-    def assign_roles(agent_ids: List[str], config: Dict) -> Dict[str, str]:
-        """Randomly assign roles to agents"""
+    def assign_roles(
+        agent_ids: List[str],
+        config: Dict,
+        rng: Optional[random.Random] = None
+    ) -> Dict[str, str]:
+        """Randomly assign roles to agents, using rng if given for reproducible games"""
         roles = []
 
         # Add werewolves
@@ -34,7 +38,7 @@ class StateManager:
             roles.append(AgentRole.VILLAGER.value)
 
         # Shuffle and assign
-        random.shuffle(roles)
+        (rng or random).shuffle(roles)
         return {agent_id: role for agent_id, role in zip(agent_ids, roles)}
 
     @staticmethod
@@ -79,9 +83,13 @@ class StateManager:
             return GamePhase.DAY_DISCUSSION
 
     @staticmethod
-    def process_voting_results(game_state: GameState) -> Optional[str]:
+    def process_voting_results(
+        game_state: GameState,
+        rng: Optional[random.Random] = None
+    ) -> Optional[str]:
         """
         Process voting results and determine who gets eliminated.
+        Ties are broken with rng if given, so seeded games replay the same way.
         Returns the ID of the eliminated agent, or None if no elimination.
         """
         if not game_state.current_votes:
@@ -105,7 +113,7 @@ class StateManager:
         if len(candidates) == 1:
             return candidates[0]
         else:
-            return random.choice(candidates) if candidates else None
+            return (rng or random).choice(candidates) if candidates else None
 
     @staticmethod
     def process_werewolf_kill(
@@ -3,50 +3,179 @@
 Enhanced with deep debug logging for White Agent decision tracking.
 """
 
-import json
+import io
 import logging
+import os
+import queue
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+import orjson
+import pydantic_core
+from pydantic import AnyUrl, BaseModel
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for compressed game logs
+    zstandard = None
 
 from app.types.game import GameState
-from app.types.agent import WerewolfAction, AgentProfile
-
-
-def _serialize_metadata_list(metadata_list: List[Dict]) -> List[Dict]:
-    """Convert datetime objects in metadata to ISO strings for JSON serialization."""
-    serialized = []
-    for item in metadata_list:
-        serialized_item = {}
-        for key, value in item.items():
-            if isinstance(value, datetime):
-                serialized_item[key] = value.isoformat()
-            else:
-                serialized_item[key] = value
-        serialized.append(serialized_item)
-    return serialized
-
-
-def _serialize_for_json(obj: Any) -> Any:
-    """Recursively serialize objects for JSON."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {k: _serialize_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_serialize_for_json(item) for item in obj]
-    elif hasattr(obj, 'value'):  # Enum
-        return obj.value
-    else:
-        return obj
+from app.types.agent import WerewolfAction, AgentProfile, ActionType
 
 logger = logging.getLogger(__name__)
 
+# Encoded events are handed to a background writer thread through a bounded
+# queue; it drains up to EVENT_BATCH_SIZE events at a time and writes them with
+# one call per log file. Callers only block if EVENT_QUEUE_SIZE events are pending.
+EVENT_QUEUE_SIZE = 10_000
+EVENT_BATCH_SIZE = 256
+
+# Default upper bound, in seconds, on waiting for the writer thread in flush()
+FLUSH_TIMEOUT = 30.0
+
+# Number of games whose parsed debug-event index is kept for the read helpers
+LOG_INDEX_CACHE_SIZE = 16
+
+# Buffer/descriptor key of the shared log file in single-file mode
+SHARED_LOG_KEY = "events"
+
+
+def _serialize_agent(agent: AgentProfile) -> Dict[str, Any]:
+    """Convert an agent profile to its agents_assigned log entry."""
+    # orjson writes the role enum as its value and the URL through _orjson_default
+    return {
+        "id": agent.agent_id,
+        "name": agent.name,
+        "url": agent.agent_url,
+        "role": agent.role,
+        "model": agent.model  # LLM model used by this agent
+    }
+
+
+@dataclass(slots=True)
+class GameCreatedEvent:
+    """Log record for a game_created event."""
+    event: str = field(default="game_created", init=False)
+    timestamp: datetime
+    game_id: str
+    agent_urls: List[str]
+    config: Dict[str, Any]
+    role_assignments: Dict[str, str]
+
+
+@dataclass(slots=True)
+class GameStartedEvent:
+    """Log record for a game_started event."""
+    event: str = field(default="game_started", init=False)
+    timestamp: datetime
+    game_id: str
+
+
+@dataclass(slots=True)
+class GameEndedEvent:
+    """Log record for a game_ended event."""
+    event: str = field(default="game_ended", init=False)
+    timestamp: datetime
+    game_id: str
+    winner: Optional[str]
+    total_rounds: int
+
+
+@dataclass(slots=True)
+class GameCompletedEvent:
+    """Log record for a game_completed event with the final game state."""
+    event: str = field(default="game_completed", init=False)
+    timestamp: datetime
+    game_id: str
+    status: str
+    phase: str
+    round: int
+    alive: List[str]
+    eliminated: List[str]
+    winner: Optional[str]
+    total_rounds: int
+    role_assignments: Dict[str, str]
+    rule_compliance: Dict[str, Any]
+
+
+@dataclass(slots=True)
+class _GameBucket:
+    """Everything GameLogger keeps in memory for one game."""
+    state: Optional[GameState] = None
+    agents: List[AgentProfile] = field(default_factory=list)
+    actions: List[WerewolfAction] = field(default_factory=list)
+    last_fingerprint: Optional[int] = None
+    # Cached get_game_summary() result, cleared whenever the game is saved
+    summary: Optional[Dict[str, Any]] = None
+    # Bumped for every event logged for the game, so log indexes can tell they're stale
+    events_version: int = 0
+
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson fallback for the non-native types that appear in events, such as pydantic URLs."""
+    if isinstance(obj, (AnyUrl, pydantic_core.Url)):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# orjson handles datetimes, enums and the event dataclasses natively; non-string
+# keys are stringified like the stdlib json module did.
+_EVENT_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+
+def _read_log_events(
+    log_file: Path,
+    compressed: bool,
+    game_id: Optional[str] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Parse the events in a JSONL game log, or return None if it can't be read.
+
+    If game_id is given, only that game's events are returned (for the shared log file).
+    """
+    if not log_file.exists():
+        return None
+
+    events = []
+    try:
+        with open(log_file, "rb") as f:
+            lines = f
+            if compressed:
+                lines = io.BufferedReader(
+                    zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+                )
+            for line in lines:
+                if line.strip():
+                    event = orjson.loads(line)
+                    if game_id is None or event.get("game_id") == game_id:
+                        events.append(event)
+    except Exception as e:
+        logger.error(f"Failed to read log file: {e}")
+        return None
+
+    return events
+
 
 class GameLogger:
     """Handles game data storage with both in-memory cache and file persistence."""
 
-    def __init__(self, log_dir: str = "game_logs", subfolder: str = "baseline", game_name: str = None):
+    def __init__(
+        self,
+        log_dir: str = "game_logs",
+        subfolder: str = "baseline",
+        game_name: str = None,
+        compress_logs: bool = None,
+        single_file_mode: bool = False
+    ):
         """
         Initialize the game logger.
         
@@ -54,102 +183,136 @@ class GameLogger:
             log_dir: Base directory for logs (default: "game_logs")
             subfolder: Subfolder to use ("baseline" or "optimized", default: "baseline")
             game_name: Custom name for log files (if None, uses game_id)
+            compress_logs: Write zstd-compressed .jsonl.zst logs (if None, uses COMPRESS_GAME_LOGS)
+            single_file_mode: Append every game's events to one shared events.jsonl file
         """
         self.log_dir = Path(log_dir) / subfolder
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         # Get custom game name from environment variable if not provided
         if game_name is None:
-            import os
             game_name = os.getenv("GAME_NAME", "")
         self.game_name = game_name if game_name else None
 
-        self.active_games: Dict[str, GameState] = {}
-        self.game_agents: Dict[str, List[AgentProfile]] = {}
-        self.game_actions: Dict[str, List[WerewolfAction]] = {}
-        self.last_logged_states: Dict[str, Dict[str, Any]] = {}
+        if compress_logs is None:
+            compress_logs = os.getenv("COMPRESS_GAME_LOGS", "").lower() in ("1", "true", "yes")
+        if compress_logs and zstandard is None:
+            raise RuntimeError("zstandard is required for compressed game logs")
+        self.compress_logs = compress_logs
+        # Level 1 keeps compression cheap enough for the write path
+        self._compressor = zstandard.ZstdCompressor(level=1) if compress_logs else None
+        self.single_file_mode = single_file_mode
+
+        # In-memory state of each game, one bucket per game_id; indexing creates
+        # the bucket on first use, getters use .get() so reads never do
+        self.games: Dict[str, _GameBucket] = defaultdict(_GameBucket)
+        # Bumped whenever any game's summary is invalidated
+        self.summaries_version = 0
+        self._all_summaries: List[Dict[str, Any]] = []
+        self._all_summaries_version = -1
+
+        # Append-only descriptors for each log file, opened on first write
+        self._fds: Dict[str, int] = {}
+
+        # (log file key, encoded event) pairs for the writer thread. A threading.Event
+        # in the queue is a flush marker and None tells the writer to stop.
+        self._write_queue: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # Serializes writes and descriptor changes
+        self._io_lock = threading.Lock()
+
+        # Parsed log events per game, grouped by (event type, agent_id); dropped
+        # whenever the game logs a new event
+        self._log_indexes: OrderedDict[str, Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]]] = OrderedDict()
 
     def save_game(self, game_state: GameState, force_log: bool = False) -> None:
         """Save or update game state."""
-        self.active_games[game_state.game_id] = game_state
+        bucket = self.games[game_state.game_id]
+        bucket.state = game_state
+        self._invalidate_summary(bucket)
 
         # Check if state has changed or if forced to log
-        if force_log or self._has_state_changed(game_state):
+        snapshot = self._state_snapshot(game_state)
+        fingerprint = hash(snapshot)
+        if force_log or self._has_state_changed(bucket, fingerprint):
+            status, phase, round_number, alive, eliminated, winner = snapshot
             self._write_game_event(game_state.game_id, {
                 "event": "game_update",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcnow(),
                 "game_id": game_state.game_id,
-                "status": game_state.status.value,
-                "phase": game_state.phase.value,
-                "round": game_state.round_number,
-                "alive": game_state.alive_agent_ids,
-                "eliminated": game_state.eliminated_agent_ids,
-                "winner": game_state.winner
+                "status": status,
+                "phase": phase,
+                "round": round_number,
+                "alive": alive,
+                "eliminated": eliminated,
+                "winner": winner
             })
             
             # Update the last logged state
-            self.last_logged_states[game_state.game_id] = {
-                "status": game_state.status.value,
-                "phase": game_state.phase.value,
-                "round": game_state.round_number,
-                "alive": game_state.alive_agent_ids.copy(),
-                "eliminated": game_state.eliminated_agent_ids.copy(),
-                "winner": game_state.winner
-            }
+            bucket.last_fingerprint = fingerprint
 
     def get_game(self, game_id: str) -> Optional[GameState]:
         """Get game state by ID from memory."""
-        return self.active_games.get(game_id)
+        bucket = self.games.get(game_id)
+        return bucket.state if bucket else None
 
     def save_agents(self, game_id: str, agents: List[AgentProfile]) -> None:
         """Save agent profiles for a game."""
-        self.game_agents[game_id] = agents
+        self.games[game_id].agents = agents
 
         self._write_game_event(game_id, {
             "event": "agents_assigned",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "game_id": game_id,
-            "agents": [
-                {
-                    "id": agent.agent_id,
-                    "name": agent.name,
-                    "url": str(agent.agent_url),
-                    "role": agent.role.value if agent.role else None,
-                    "model": agent.model  # LLM model used by this agent
-                }
-                for agent in agents
-            ]
+            "agents": [_serialize_agent(agent) for agent in agents]
         })
 
     def get_agents(self, game_id: str) -> List[AgentProfile]:
         """Get all agents in a game."""
-        return self.game_agents.get(game_id, [])
+        bucket = self.games.get(game_id)
+        return bucket.agents if bucket else []
 
-    def save_action(self, game_id: str, action: WerewolfAction, round_number: int = None) -> None:
-        """Save an action taken in a game."""
-        if game_id not in self.game_actions:
-            self.game_actions[game_id] = []
-        
+    def save_action(
+        self,
+        game_id: str,
+        action: WerewolfAction,
+        round_number: int = None,
+        game_state: Optional[GameState] = None
+    ) -> None:
+        """
+        Save an action taken in a game.
+
+        Args:
+            game_id: Game ID
+            action: The action to save
+            round_number: Round the action was taken in
+            game_state: Current game state, if the caller already has it (avoids a lookup)
+        """
         # Add round number to action metadata if not already present
         if round_number is not None and "round_number" not in action.metadata:
             action.metadata["round_number"] = round_number
         
-        self.game_actions[game_id].append(action)
+        bucket = self.games[game_id]
+        bucket.actions.append(action)
+        self._invalidate_summary(bucket)
 
+        action_type = action.action_type
+        target_agent_id = action.target_agent_id
         event_data = {
             "event": "action",
-            "timestamp": action.timestamp.isoformat(),
+            "timestamp": action.timestamp,
             "game_id": game_id,
             "agent_id": action.agent_id,
-            "action_type": action.action_type.value,
-            "target": action.target_agent_id,
+            "action_type": action_type.value,
+            "target": target_agent_id,
             "confidence": action.confidence,
             "reasoning": action.reasoning,
             "round_number": round_number
         }
         
         # Add discussion sub-action information
-        if action.action_type.value == "discuss":
+        if action_type is ActionType.DISCUSS:
             # Support new format with multiple subactions and targets
             if action.discussion_subactions:
                 event_data["discussion_subactions"] = [s.value for s in action.discussion_subactions]
@@ -164,14 +327,15 @@ class GameLogger:
                 event_data["revealed_information"] = action.revealed_information
         
         # Add investigation result for seer actions
-        if action.action_type.value == "investigate" and action.target_agent_id:
+        if action_type is ActionType.INVESTIGATE and target_agent_id:
             # Get the game state to determine if target is werewolf
-            game_state = self.get_game(game_id)
+            if game_state is None:
+                game_state = self.get_game(game_id)
             if game_state:
-                target_role = game_state.role_assignments.get(action.target_agent_id)
+                target_role = game_state.role_assignments.get(target_agent_id)
                 is_werewolf = target_role == "werewolf"
                 event_data["investigation_result"] = {
-                    "target_id": action.target_agent_id,
+                    "target_id": target_agent_id,
                     "is_werewolf": is_werewolf
                 }
         
@@ -179,7 +343,8 @@ class GameLogger:
 
     def get_game_actions(self, game_id: str) -> List[WerewolfAction]:
         """Get all actions in a game."""
-        return self.game_actions.get(game_id, [])
+        bucket = self.games.get(game_id)
+        return bucket.actions if bucket else []
 
     def get_agent_actions(self, game_id: str, agent_id: str) -> List[WerewolfAction]:
         """Get all actions by a specific agent in a game."""
@@ -188,41 +353,47 @@ class GameLogger:
 
     def log_game_created(self, game_state: GameState, agent_urls: List[str]) -> None:
         """Log game creation event."""
-        self.active_games[game_state.game_id] = game_state
-
-        event = {
-            "event": "game_created",
-            "timestamp": datetime.utcnow().isoformat(),
-            "game_id": game_state.game_id,
-            "agent_urls": agent_urls,
-            "config": game_state.config.model_dump(),
-            "role_assignments": game_state.role_assignments
-        }
-        self._write_game_event(game_state.game_id, event)
+        bucket = self.games[game_state.game_id]
+        bucket.state = game_state
+        self._invalidate_summary(bucket)
+
+        self._write_game_event(game_state.game_id, GameCreatedEvent(
+            timestamp=datetime.utcnow(),
+            game_id=game_state.game_id,
+            agent_urls=agent_urls,
+            config=game_state.config.model_dump(),
+            role_assignments=game_state.role_assignments
+        ))
 
     def log_game_started(self, game_id: str) -> None:
         """Log game start event."""
-        self._write_game_event(game_id, {
-            "event": "game_started",
-            "timestamp": datetime.utcnow().isoformat(),
-            "game_id": game_id
-        })
+        self._write_game_event(game_id, GameStartedEvent(
+            timestamp=datetime.utcnow(),
+            game_id=game_id
+        ))
 
-    def log_game_ended(self, game_id: str, winner: str, rounds: int) -> None:
-        """Log game end event."""
-        self._write_game_event(game_id, {
-            "event": "game_ended",
-            "timestamp": datetime.utcnow().isoformat(),
-            "game_id": game_id,
-            "winner": winner,
-            "total_rounds": rounds
-        })
+    def log_game_ended(self, game_id: str, winner: str, rounds: int, release: bool = True) -> None:
+        """
+        Log game end event.
+
+        With release=False the caller is responsible for close_game(), e.g. to run
+        the blocking flush off the event loop.
+        """
+        self._write_game_event(game_id, GameEndedEvent(
+            timestamp=datetime.utcnow(),
+            game_id=game_id,
+            winner=winner,
+            total_rounds=rounds
+        ))
+        # Terminal event: write the whole game out and release its descriptor
+        if release:
+            self.close_game(game_id)
 
     def log_invalid_action(self, game_id: str, action: WerewolfAction, error_msg: str, round_number: int) -> None:
         """Log invalid actions for analysis."""
         self._write_game_event(game_id, {
             "event": "invalid_action",
-            "timestamp": action.timestamp.isoformat(),
+            "timestamp": action.timestamp,
             "game_id": game_id,
             "agent_id": action.agent_id,
             "action_type": action.action_type.value,
@@ -235,39 +406,71 @@ class GameLogger:
             "discussion_content": getattr(action, 'discussion_content', None)
         })
 
-    def log_game_completed(self, game_state: GameState) -> None:
-        """Log game completion with final state."""
-        print(f"DEBUG: Logging game_completed for {game_state.game_id}")
+    def log_game_completed(self, game_state: GameState, flush: bool = True) -> None:
+        """
+        Log game completion with final state.
+
+        With flush=False the caller is responsible for flushing, e.g. off the event loop.
+        """
+        logger.debug("Logging game_completed for %s", game_state.game_id)
+        bucket = self.games.get(game_state.game_id)
+        if bucket:
+            self._invalidate_summary(bucket)
         try:
-            self._write_game_event(game_state.game_id, {
-            "event": "game_completed",
-            "timestamp": datetime.utcnow().isoformat(),
-            "game_id": game_state.game_id,
-            "status": game_state.status.value,
-            "phase": game_state.phase.value,
-            "round": game_state.round_number,
-            "alive": game_state.alive_agent_ids,
-            "eliminated": game_state.eliminated_agent_ids,
-            "winner": game_state.winner,
-            "total_rounds": game_state.round_number,
-            "role_assignments": game_state.role_assignments,
-            "rule_compliance": game_state.metadata.get("rule_compliance", {})
-        })
-        except Exception as e:
-            print(f"ERROR: Failed to log game_completed: {e}")
-            import traceback
-            traceback.print_exc()
+            self._write_game_event(game_state.game_id, GameCompletedEvent(
+                timestamp=datetime.utcnow(),
+                game_id=game_state.game_id,
+                status=game_state.status.value,
+                phase=game_state.phase.value,
+                round=game_state.round_number,
+                alive=game_state.alive_agent_ids,
+                eliminated=game_state.eliminated_agent_ids,
+                winner=game_state.winner,
+                total_rounds=game_state.round_number,
+                role_assignments=game_state.role_assignments,
+                rule_compliance=game_state.metadata.get("rule_compliance", {})
+            ))
+            # Terminal event: make sure the whole game is on disk
+            if flush:
+                self.flush(game_state.game_id)
+        except Exception:
+            logger.exception("Failed to log game_completed")
 
     def list_games(self) -> List[str]:
         """List all game IDs."""
-        return list(self.active_games.keys())
+        return [game_id for game_id, bucket in self.games.items() if bucket.state is not None]
+
+    def get_all_summaries(self) -> List[Dict[str, Any]]:
+        """
+        Get the summaries of all games.
+
+        The list is rebuilt only after a game changes, and then only the changed
+        games' summaries are recomputed. Callers get copies, so changing them
+        doesn't touch the cache.
+        """
+        if self._all_summaries_version != self.summaries_version:
+            self._all_summaries = [
+                self._cached_summary(game_id) for game_id in self.list_games()
+            ]
+            self._all_summaries_version = self.summaries_version
+        return [dict(summary) for summary in self._all_summaries]
 
     def get_game_summary(self, game_id: str) -> Optional[Dict[str, Any]]:
-        """Get a summary of a game."""
-        game_state = self.get_game(game_id)
-        if not game_state:
+        """Get a copy of a game's summary (cached until the game is saved again)."""
+        summary = self._cached_summary(game_id)
+        return dict(summary) if summary is not None else None
+
+    def _cached_summary(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """Get the cached summary dict of a game, building it if needed."""
+        bucket = self.games.get(game_id)
+        if not bucket or not bucket.state:
             return None
+        if bucket.summary is None:
+            bucket.summary = self._build_game_summary(game_id, bucket.state)
+        return bucket.summary
 
+    def _build_game_summary(self, game_id: str, game_state: GameState) -> Dict[str, Any]:
+        """Compute a game's summary from its current state."""
         summary = {
             "game_id": game_id,
             "status": game_state.status.value,
@@ -297,39 +500,49 @@ class GameLogger:
         investigation_reveals = game_state.metadata.get("investigation_reveals", [])
         metrics["investigation_reveals_count"] = len(investigation_reveals)
         
-        # Calculate seer-specific metrics
-        seer_reveals = [r for r in investigation_reveals if r["seer_id"] in game_state.alive_agent_ids or r["seer_id"] in game_state.eliminated_agent_ids]
-        if seer_reveals:
-            metrics["seer_reveals_per_game"] = len(seer_reveals)
-            metrics["first_seer_reveal_round"] = min([r["round"] for r in seer_reveals])
-            
-            # Calculate unmasked wolf percentage
-            total_werewolf_reveals = 0
-            correct_werewolf_reveals = 0
-            for reveal in seer_reveals:
-                for investigation in reveal.get("revealed_investigations", []):
-                    if investigation.get("is_werewolf"):
-                        total_werewolf_reveals += 1
-                        # Check if this led to the werewolf being eliminated
-                        werewolf_id = investigation.get("target_id")
-                        if werewolf_id in game_state.eliminated_agent_ids:
-                            correct_werewolf_reveals += 1
-            
-            metrics["unmasked_wolf_percentage"] = (correct_werewolf_reveals / total_werewolf_reveals * 100) if total_werewolf_reveals > 0 else 0
-            metrics["believed_percentage"] = (correct_werewolf_reveals / total_werewolf_reveals * 100) if total_werewolf_reveals > 0 else 0
-            
-            # Calculate backfired percentage (seer eliminated after revealing)
-            seer_eliminated_after_reveal = 0
-            for reveal in seer_reveals:
-                seer_id = reveal["seer_id"]
-                reveal_round = reveal["round"]
-                if seer_id in game_state.eliminated_agent_ids:
-                    # Check if seer was eliminated in the same round or shortly after
-                    seer_eliminated_round = next((r for r in game_state.round_history if seer_id in r.eliminated_agents), None)
-                    if seer_eliminated_round and seer_eliminated_round.round_number <= reveal_round + 1:
-                        seer_eliminated_after_reveal += 1
-            
-            metrics["backfired_percentage"] = (seer_eliminated_after_reveal / len(seer_reveals) * 100) if seer_reveals else 0
+        # Calculate seer-specific metrics in a single pass over the reveals
+        alive_ids = set(game_state.alive_agent_ids)
+        eliminated_ids = set(game_state.eliminated_agent_ids)
+        # Round each agent was (first) eliminated in
+        elimination_round: Dict[str, int] = {}
+        for round_record in game_state.round_history:
+            for agent_id in round_record.eliminated_agents:
+                elimination_round.setdefault(agent_id, round_record.round_number)
+        seer_reveals_count = 0
+        first_seer_reveal_round = None
+        total_werewolf_reveals = 0
+        correct_werewolf_reveals = 0
+        seer_eliminated_after_reveal = 0
+        for reveal in investigation_reveals:
+            seer_id = reveal["seer_id"]
+            if seer_id not in alive_ids and seer_id not in eliminated_ids:
+                continue
+
+            seer_reveals_count += 1
+            reveal_round = reveal["round"]
+            if first_seer_reveal_round is None or reveal_round < first_seer_reveal_round:
+                first_seer_reveal_round = reveal_round
+
+            # Unmasked wolves: werewolf reveals whose target ended up eliminated
+            for investigation in reveal.get("revealed_investigations", []):
+                if investigation.get("is_werewolf"):
+                    total_werewolf_reveals += 1
+                    if investigation.get("target_id") in eliminated_ids:
+                        correct_werewolf_reveals += 1
+
+            # Backfired: seer eliminated in the same round or shortly after revealing
+            if seer_id in eliminated_ids:
+                seer_eliminated_round = elimination_round.get(seer_id)
+                if seer_eliminated_round is not None and seer_eliminated_round <= reveal_round + 1:
+                    seer_eliminated_after_reveal += 1
+
+        if seer_reveals_count:
+            metrics["seer_reveals_per_game"] = seer_reveals_count
+            metrics["first_seer_reveal_round"] = first_seer_reveal_round
+            unmasked_percentage = (correct_werewolf_reveals / total_werewolf_reveals * 100) if total_werewolf_reveals > 0 else 0
+            metrics["unmasked_wolf_percentage"] = unmasked_percentage
+            metrics["believed_percentage"] = unmasked_percentage
+            metrics["backfired_percentage"] = seer_eliminated_after_reveal / seer_reveals_count * 100
         
         # Accusation metrics
         accusations = game_state.metadata.get("accusations", [])
@@ -356,63 +569,228 @@ class GameLogger:
         
         return metrics
 
-    def _has_state_changed(self, game_state: GameState) -> bool:
+    def _state_snapshot(self, game_state: GameState) -> Tuple[Any, ...]:
+        """Build an immutable snapshot of the fields that trigger a game_update event."""
+        return (
+            game_state.status.value,
+            game_state.phase.value,
+            game_state.round_number,
+            tuple(game_state.alive_agent_ids),
+            tuple(game_state.eliminated_agent_ids),
+            game_state.winner
+        )
+
+    def _invalidate_summary(self, bucket: _GameBucket) -> None:
+        """Drop a game's cached summary after its state or actions changed."""
+        bucket.summary = None
+        self.summaries_version += 1
+
+    def _has_state_changed(self, bucket: _GameBucket, fingerprint: int) -> bool:
         """Check if the game state has changed since last logged."""
-        game_id = game_state.game_id
-        last_state = self.last_logged_states.get(game_id)
-        
-        if not last_state:
-            return True  # First time logging this game
-        
-        # Check if any key fields have changed
-        current_state = {
-            "status": game_state.status.value,
-            "phase": game_state.phase.value,
-            "round": game_state.round_number,
-            "alive": game_state.alive_agent_ids,
-            "eliminated": game_state.eliminated_agent_ids,
-            "winner": game_state.winner
-        }
-        
-        # Compare with last logged state
-        for key, current_value in current_state.items():
-            if last_state.get(key) != current_value:
-                return True
-                
-        return False
-
-    def _write_game_event(self, game_id: str, event: Dict[str, Any]) -> None:
-        """Write an event to the game's log file."""
+        # None (first time logging this game) never equals a hash
+        return bucket.last_fingerprint != fingerprint
+
+    def _get_log_path(self, game_id: str) -> Path:
+        """Get the log file path for a game."""
+        suffix = ".jsonl.zst" if self.compress_logs else ".jsonl"
+        if self.single_file_mode:
+            return self.log_dir / f"events{suffix}"
+
         # Use custom name if set, otherwise use game_id
         file_name = self.game_name if self.game_name else game_id
-        log_file = self.log_dir / f"game_{file_name}.jsonl"
+        return self.log_dir / f"game_{file_name}{suffix}"
 
+    def _file_key(self, game_id: str) -> str:
+        """Key of the log file a game's events go to (shared in single-file mode)."""
+        return SHARED_LOG_KEY if self.single_file_mode else game_id
+
+    def _write_game_event(self, game_id: str, event: Any) -> None:
+        """Write an event (a dict or an event record) to the game's log file."""
         try:
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            payload = orjson.dumps(event, default=_orjson_default, option=_EVENT_OPTIONS)
         except Exception as e:
             logger.error(f"Failed to write event to log file: {e}")
+            return
+
+        self._append(game_id, payload)
+
+    def _append(self, game_id: str, payload: bytes) -> None:
+        """Queue an encoded event line for the game's log file."""
+        self.games[game_id].events_version += 1
+        self._log_indexes.pop(game_id, None)
+        if self._writer_thread is None:
+            self._start_writer()
+        self._write_queue.put((self._file_key(game_id), payload))
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread, if it isn't running yet."""
+        with self._writer_lock:
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._drain_loop,
+                    name="game-log-writer",
+                    daemon=True
+                )
+                self._writer_thread.start()
+
+    def _drain_loop(self) -> None:
+        """Write queued events in batches until told to stop."""
+        write_queue = self._write_queue
+        while True:
+            items = [write_queue.get()]
+            while len(items) < EVENT_BATCH_SIZE:
+                try:
+                    items.append(write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            batches: Dict[str, List[bytes]] = defaultdict(list)
+            stop = False
+            for item in items:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    # Everything queued before the marker goes out before it is set;
+                    # the marker is set even if writing fails so flush() can't hang
+                    try:
+                        self._write_batches(batches)
+                    finally:
+                        batches.clear()
+                        item.set()
+                else:
+                    file_key, payload = item
+                    batches[file_key].append(payload)
+            self._write_batches(batches)
+
+            if stop:
+                return
+
+    def _write_batches(self, batches: Dict[str, List[bytes]]) -> None:
+        """Write each log file's batch of encoded events with a single call."""
+        with self._io_lock:
+            for file_key, batch in batches.items():
+                try:
+                    if self._compressor:
+                        # Each batch is a self-contained zstd frame appended to the file
+                        batch = [self._compressor.compress(b"".join(batch))]
+
+                    fd = self._fds.get(file_key)
+                    if fd is None:
+                        # O_APPEND makes each write land atomically at the end of the file
+                        fd = os.open(
+                            str(self._get_log_path(file_key)),
+                            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                            0o644
+                        )
+                        self._fds[file_key] = fd
+                    # One writev per batch instead of joining the lines first
+                    written = os.writev(fd, batch)
+                    if written < sum(map(len, batch)):
+                        remaining = b"".join(batch)[written:]
+                        while remaining:
+                            remaining = remaining[os.write(fd, remaining):]
+                except Exception as e:
+                    logger.error(f"Failed to write event to log file: {e}")
+
+    def flush(self, game_id: Optional[str] = None, timeout: Optional[float] = FLUSH_TIMEOUT) -> bool:
+        """
+        Wait until every event queued so far is written to disk.
+
+        Events are queued in order, so this flushes every game, not just game_id.
+        Returns False if the timeout expired first.
+        """
+        if self._writer_thread is None:
+            return True
+        written = threading.Event()
+        try:
+            self._write_queue.put(written, timeout=timeout)
+        except queue.Full:
+            written = None
+        if written is None or not written.wait(timeout):
+            logger.warning(f"Timed out after {timeout}s waiting for game log events to be written")
+            return False
+        return True
+
+    def close_game(self, game_id: str) -> None:
+        """Flush a game's pending events and release its log file descriptor."""
+        self.flush(game_id)
+        if self.single_file_mode:
+            # The shared file stays open for the other games until close()
+            return
+        self._close_file(game_id)
+
+    def _close_file(self, file_key: str) -> None:
+        """Close a log file's descriptor; it is reopened if the file is written again."""
+        with self._io_lock:
+            fd = self._fds.pop(file_key, None)
+            if fd is not None:
+                os.close(fd)
+
+    def close(self) -> None:
+        """Stop the background writer once everything queued is written, and release all descriptors."""
+        with self._writer_lock:
+            writer_thread = self._writer_thread
+            if writer_thread is not None:
+                self._write_queue.put(None)
+                writer_thread.join()
+                self._writer_thread = None
+
+        for file_key in list(self._fds):
+            self._close_file(file_key)
 
     def load_game_from_log(self, game_id: str) -> Optional[Dict[str, Any]]:
         """Load a game's history from its log file."""
-        # Use custom name if set, otherwise use game_id
-        file_name = self.game_name if self.game_name else game_id
-        log_file = self.log_dir / f"game_{file_name}.jsonl"
+        self.flush(game_id)
+        if self.single_file_mode:
+            events = _read_log_events(self._get_log_path(game_id), self.compress_logs, game_id)
+            if not events:
+                return None
+        else:
+            events = _read_log_events(self._get_log_path(game_id), self.compress_logs)
+            if events is None:
+                return None
 
-        if not log_file.exists():
-            return None
+        return {"game_id": game_id, "events": events}
 
-        events = []
-        try:
-            with open(log_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        events.append(json.loads(line))
-        except Exception as e:
-            logger.error(f"Failed to read log file: {e}")
-            return None
+    def load_games_bulk(
+        self,
+        game_ids: List[str],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the histories of many games, parsing each log file in its own process.
 
-        return {"game_id": game_id, "events": events}
+        Games whose log file is missing or unreadable are left out of the result.
+        In single-file mode the shared log is read once and split by game_id.
+        """
+        self.flush()
+        if self.single_file_mode:
+            events_by_game: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            for event in _read_log_events(self._get_log_path(SHARED_LOG_KEY), self.compress_logs) or []:
+                events_by_game[event.get("game_id")].append(event)
+            return {
+                game_id: {"game_id": game_id, "events": events_by_game[game_id]}
+                for game_id in game_ids
+                if game_id in events_by_game
+            }
+
+        log_files = [self._get_log_path(game_id) for game_id in game_ids]
+
+        if len(log_files) <= 1:
+            results = [_read_log_events(log_file, self.compress_logs) for log_file in log_files]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+                results = list(pool.map(
+                    _read_log_events,
+                    log_files,
+                    [self.compress_logs] * len(log_files)
+                ))
+
+        return {
+            game_id: {"game_id": game_id, "events": events}
+            for game_id, events in zip(game_ids, results)
+            if events is not None
+        }
 
     # =========================================================================
     # DEEP DEBUG LOGGING - Track exact prompts and responses for White Agents
@@ -433,7 +811,7 @@ class GameLogger:
         """
         self._write_game_event(game_id, {
             "event": "DEBUG_agent_prompt",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "game_id": game_id,
             "agent_id": agent_id,
             "phase": phase,
@@ -460,7 +838,7 @@ class GameLogger:
         """
         self._write_game_event(game_id, {
             "event": "DEBUG_agent_response",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "game_id": game_id,
             "agent_id": agent_id,
             "phase": phase,
@@ -488,17 +866,15 @@ class GameLogger:
         2. What raw response was received
         3. How it was parsed into an action
         """
-        # Serialize the action for JSON
-        serialized_action = _serialize_for_json(parsed_action)
-        
+        # orjson serializes the nested datetimes and enums in parsed_action itself
         self._write_game_event(game_id, {
             "event": "DEBUG_agent_action_detail",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "game_id": game_id,
             "agent_id": agent_id,
             "input_prompt": prompt,
             "raw_output": raw_response,
-            "parsed_action": serialized_action,
+            "parsed_action": parsed_action,
             "prompt_tokens_estimate": len(prompt.split()),
             "response_tokens_estimate": len(raw_response.split())
         })
@@ -516,7 +892,7 @@ class GameLogger:
         """
         self._write_game_event(game_id, {
             "event": "DEBUG_agent_error",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "game_id": game_id,
             "agent_id": agent_id,
             "error_type": error_type,
@@ -537,19 +913,7 @@ class GameLogger:
         Returns:
             List of prompt events
         """
-        game_log = self.load_game_from_log(game_id)
-        if not game_log:
-            return []
-        
-        prompts = [
-            event for event in game_log.get("events", [])
-            if event.get("event") == "DEBUG_agent_prompt"
-        ]
-        
-        if agent_id:
-            prompts = [p for p in prompts if p.get("agent_id") == agent_id]
-        
-        return prompts
+        return self._indexed_events(game_id, "DEBUG_agent_prompt", agent_id)
 
     def get_agent_responses(self, game_id: str, agent_id: str = None) -> List[Dict[str, Any]]:
         """
@@ -562,30 +926,11 @@ class GameLogger:
         Returns:
             List of response events
         """
-        game_log = self.load_game_from_log(game_id)
-        if not game_log:
-            return []
-        
-        responses = [
-            event for event in game_log.get("events", [])
-            if event.get("event") == "DEBUG_agent_response"
-        ]
-        
-        if agent_id:
-            responses = [r for r in responses if r.get("agent_id") == agent_id]
-        
-        return responses
+        return self._indexed_events(game_id, "DEBUG_agent_response", agent_id)
 
     def get_agent_errors(self, game_id: str) -> List[Dict[str, Any]]:
         """Get all agent errors in a game."""
-        game_log = self.load_game_from_log(game_id)
-        if not game_log:
-            return []
-        
-        return [
-            event for event in game_log.get("events", [])
-            if event.get("event") == "DEBUG_agent_error"
-        ]
+        return self._indexed_events(game_id, "DEBUG_agent_error")
 
     def get_decision_trace(self, game_id: str, agent_id: str, round_number: int = None) -> List[Dict[str, Any]]:
         """
@@ -593,18 +938,8 @@ class GameLogger:
         
         Returns prompt->response->action sequences for debugging.
         """
-        game_log = self.load_game_from_log(game_id)
-        if not game_log:
-            return []
-        
-        events = game_log.get("events", [])
-        
-        # Filter for this agent's detailed action events
-        traces = [
-            event for event in events
-            if event.get("event") == "DEBUG_agent_action_detail"
-            and event.get("agent_id") == agent_id
-        ]
+        # This agent's detailed action events
+        traces = self._indexed_events(game_id, "DEBUG_agent_action_detail", agent_id)
         
         if round_number:
             traces = [
@@ -613,3 +948,43 @@ class GameLogger:
             ]
         
         return traces
+
+    def _indexed_events(
+        self,
+        game_id: str,
+        event_type: str,
+        agent_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a game's logged events of one type, optionally for a single agent.
+
+        The log is parsed and indexed once and reused until the game logs another event.
+        """
+        index = self._log_indexes.get(game_id)
+        if index is None:
+            # Taken before reading: an event logged meanwhile means this index is stale
+            version = self._events_version(game_id)
+            game_log = self.load_game_from_log(game_id)
+            if not game_log:
+                return []
+
+            index = defaultdict(list)
+            for event in game_log["events"]:
+                event_name = event.get("event")
+                index[(event_name, None)].append(event)
+                if event.get("agent_id"):
+                    index[(event_name, event.get("agent_id"))].append(event)
+
+            if self._events_version(game_id) == version:
+                self._log_indexes[game_id] = index
+                if len(self._log_indexes) > LOG_INDEX_CACHE_SIZE:
+                    self._log_indexes.popitem(last=False)
+        else:
+            self._log_indexes.move_to_end(game_id)
+
+        return list(index.get((event_type, agent_id or None), []))
+
+    def _events_version(self, game_id: str) -> int:
+        """Get how many events have been logged for a game."""
+        bucket = self.games.get(game_id)
+        return bucket.events_version if bucket else 0
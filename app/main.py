@@ -1,23 +1,29 @@
 """Werewolf Benchmark Green Agent - A2A Server"""
 
 import os
+import sys
 import logging
-import json
 import tomllib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 import uvicorn
 from dotenv import load_dotenv
 
-from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
-from a2a.types import AgentCard
+from a2a.server.context import ServerCallContext
+from a2a.types import AgentCard, Task
 from a2a.utils import new_agent_text_message
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 
+from app.a2a_utils import CachedAgentCardApplication, dumps_text, parse_task_data
 from app.orchestrator import GameOrchestrator
 from app.logging.storage import GameLogger
 from app.types.game import GameConfig
@@ -30,75 +36,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global state
-storage: Optional[GameLogger] = None
-orchestrator: Optional[GameOrchestrator] = None
 
+def make_lifespan(storage: GameLogger, orchestrator: GameOrchestrator):
+    """Build the server lifespan that releases the orchestrator and storage on shutdown."""
 
-def init_globals():
-    """Initialize global storage and orchestrator."""
-    global storage, orchestrator
-    storage = GameLogger()
-    orchestrator = GameOrchestrator(storage)
-    logger.info("Initialized Werewolf Benchmark Green Agent")
-
-
-async def cleanup_globals():
-    """Cleanup global resources."""
-    global orchestrator
-    if orchestrator:
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        yield
         await orchestrator.close()
+        # Writes out any buffered game log events
+        storage.close()
+
+    return lifespan
 
 
 class WerewolfGreenAgentExecutor(AgentExecutor):
     """Executor for Werewolf Benchmark Green Agent."""
 
+    def __init__(self, storage: GameLogger, orchestrator: GameOrchestrator):
+        """Initialize the executor and its task dispatch table."""
+        super().__init__()
+        self.storage = storage
+        self.orchestrator = orchestrator
+        self._task_handlers = {
+            "start_game": self._handle_start_game,
+            "get_game_status": self._handle_get_game_status,
+            "list_games": self._handle_list_games,
+        }
+
     async def execute(
         self,
         context: RequestContext,
         event_queue: EventQueue,
     ) -> None:
         """Execute a task based on the incoming message."""
-        global storage, orchestrator
-
         # Parse the incoming message
-        user_message = context.message
-        task_name = None
-        task_params = {}
-
-        for part in user_message.parts:
-            if hasattr(part, 'root') and hasattr(part.root, 'text'):
-                text = part.root.text
-            elif hasattr(part, 'text'):
-                text = part.text
-            else:
-                continue
-
-            try:
-                task_data = json.loads(text)
-                task_name = task_data.get("task")
-                task_params = task_data.get("parameters", {})
-                break
-            except json.JSONDecodeError:
-                continue
+        task_data = parse_task_data(context.message.parts) or {}
+        task_name = task_data.get("task")
+        task_params = task_data.get("parameters", {})
 
         try:
-            if task_name == "start_game":
-                result = await self._handle_start_game(task_params)
-            elif task_name == "get_game_status":
-                result = await self._handle_get_game_status(task_params)
-            elif task_name == "list_games":
-                result = await self._handle_list_games(task_params)
+            handler = self._task_handlers.get(task_name)
+            if handler:
+                result = await handler(task_params)
             else:
                 result = {"error": f"Unknown task: {task_name}"}
 
             # Send response
-            response_message = new_agent_text_message(json.dumps(result))
+            response_message = new_agent_text_message(dumps_text(result))
             await event_queue.enqueue_event(response_message)
 
         except Exception as e:
             logger.error(f"Error executing task: {e}", exc_info=True)
-            error_message = new_agent_text_message(json.dumps({"error": str(e)}))
+            error_message = new_agent_text_message(dumps_text({"error": str(e)}))
             await event_queue.enqueue_event(error_message)
 
     async def _handle_start_game(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -111,7 +101,7 @@ class WerewolfGreenAgentExecutor(AgentExecutor):
             raise ValueError("Minimum 4 agents required")
 
         game_config = GameConfig(**config) if config else None
-        game_id = await orchestrator.start_game(agent_urls, game_config, agent_models)
+        game_id = await self.orchestrator.start_game(agent_urls, game_config, agent_models)
 
         return {
             "game_id": game_id,
@@ -125,14 +115,15 @@ class WerewolfGreenAgentExecutor(AgentExecutor):
         if not game_id:
             raise ValueError("game_id is required")
 
-        game_state = storage.get_game(game_id)
+        game_state = self.storage.get_game(game_id)
         if not game_state:
             raise ValueError(f"Game {game_id} not found")
 
         return {
             "game_id": game_id,
-            "status": game_state.status.value,
-            "phase": game_state.phase.value,
+            # str enums: orjson writes their values directly
+            "status": game_state.status,
+            "phase": game_state.phase,
             "round_number": game_state.round_number,
             "alive_agents": game_state.alive_agent_ids,
             "eliminated_agents": game_state.eliminated_agent_ids,
@@ -141,13 +132,10 @@ class WerewolfGreenAgentExecutor(AgentExecutor):
 
     async def _handle_list_games(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle list_games task."""
-        summaries = [
-            storage.get_game_summary(game_id)
-            for game_id in storage.list_games()
-        ]
+        summaries = self.storage.get_all_summaries()
         return {
             "total_games": len(summaries),
-            "games": [s for s in summaries if s]
+            "games": summaries
         }
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
@@ -155,6 +143,23 @@ class WerewolfGreenAgentExecutor(AgentExecutor):
         pass
 
 
+class BoundedTaskStore(InMemoryTaskStore):
+    """InMemoryTaskStore that evicts the least recently saved tasks beyond maxsize."""
+
+    def __init__(self, maxsize: int = 10_000):
+        super().__init__()
+        self.tasks: OrderedDict[str, Task] = OrderedDict()
+        self.maxsize = maxsize
+
+    async def save(self, task: Task, context: Optional[ServerCallContext] = None) -> None:
+        """Save or update a task, dropping the oldest ones once the store is full."""
+        async with self.lock:
+            self.tasks[task.id] = task
+            self.tasks.move_to_end(task.id)
+            while len(self.tasks) > self.maxsize:
+                self.tasks.popitem(last=False)
+
+
 def load_agent_card_toml(agent_name: str = "green_agent") -> dict:
     """Load agent card configuration from TOML file."""
     # Look for TOML file in project root
@@ -167,8 +172,9 @@ def start_green_agent(agent_name: str = "green_agent", host: str = "localhost",
     """Start the green agent server."""
     logger.info("Starting Werewolf Benchmark Green Agent...")
 
-    # Initialize globals
-    init_globals()
+    storage = GameLogger()
+    orchestrator = GameOrchestrator(storage)
+    logger.info("Initialized Werewolf Benchmark Green Agent")
 
     # Load agent card from TOML
     agent_card_dict = load_agent_card_toml(agent_name)
@@ -182,19 +188,33 @@ def start_green_agent(agent_name: str = "green_agent", host: str = "localhost",
 
     # Create request handler with executor
     request_handler = DefaultRequestHandler(
-        agent_executor=WerewolfGreenAgentExecutor(),
-        task_store=InMemoryTaskStore(),
+        agent_executor=WerewolfGreenAgentExecutor(storage, orchestrator),
+        # Bounded so a long-running benchmark doesn't keep every task in memory
+        task_store=BoundedTaskStore(maxsize=int(os.getenv("TASK_STORE_MAX", "10000"))),
     )
 
     # Create A2A application
     agent_card = AgentCard(**agent_card_dict)
-    a2a_app = A2AStarletteApplication(
+    a2a_app = CachedAgentCardApplication(
         agent_card=agent_card,
         http_handler=request_handler,
     )
 
     # Run the server - controller handles /status and /agents
-    uvicorn.run(a2a_app.build(), host=host, port=port)
+    uvicorn.run(
+        a2a_app.build(
+            lifespan=make_lifespan(storage, orchestrator),
+            # list_games and game status bodies are large, repetitive JSON
+            middleware=[Middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)],
+        ),
+        host=host,
+        port=port,
+        # Require the C event loop and HTTP parser (uvicorn[standard]) instead of
+        # silently falling back to asyncio/h11; uvloop has no Windows build
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        access_log=False,
+    )
 
 
 if __name__ == "__main__":
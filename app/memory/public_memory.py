@@ -16,13 +16,23 @@ Design Decisions:
 3. Memory ID for versioning (can track what information agent has seen)
 """
 
-import uuid
+import bisect
+import secrets
+import sys
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 
+# Distinct (version, max_rounds) summaries kept per memory
+SUMMARY_CACHE_SIZE = 4
 
-@dataclass
+# Discussions longer than this are truncated in the compact summary
+SUMMARY_PREVIEW_CHARS = 300
+
+
+@dataclass(slots=True)
 class PhaseEvent:
     """A single event within a phase."""
     event_type: str  # "discussion", "vote", "elimination", "phase_start", "phase_end"
@@ -30,10 +40,10 @@ class PhaseEvent:
     target_id: Optional[str] = None
     content: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.utcnow)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None  # only set by events that carry details
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseRecord:
     """Record of all events in a single phase."""
     round_number: int
@@ -43,6 +53,44 @@ class PhaseRecord:
     ended_at: Optional[datetime] = None
 
 
+@dataclass(slots=True)
+class _DiscussionColumns:
+    """Discussions of a single round stored as parallel per-field lists.
+
+    Summaries and serialization only read a few fields per discussion, so
+    keeping them in columns avoids walking PhaseEvent objects and their
+    metadata dicts.
+    """
+    agent_ids: List[str] = field(default_factory=list)
+    contents: List[Optional[str]] = field(default_factory=list)
+    discussion_types: List[str] = field(default_factory=list)
+    targets: List[List[str]] = field(default_factory=list)
+    timestamps: List[datetime] = field(default_factory=list)
+    previews: List[str] = field(default_factory=list)  # truncated content for summaries
+
+    def append(
+        self,
+        agent_id: str,
+        content: Optional[str],
+        discussion_type: str,
+        targets: List[str],
+        timestamp: datetime
+    ) -> None:
+        """Append one discussion to every column."""
+        self.agent_ids.append(agent_id)
+        self.contents.append(content)
+        self.discussion_types.append(discussion_type)
+        self.targets.append(targets)
+        self.timestamps.append(timestamp)
+        content = content or ""
+        if len(content) > SUMMARY_PREVIEW_CHARS:
+            content = content[:SUMMARY_PREVIEW_CHARS - 3] + "..."
+        self.previews.append(content)
+
+    def __len__(self) -> int:
+        return len(self.agent_ids)
+
+
 class PublicGameMemory:
     """
     Shared memory for public game information.
@@ -56,21 +104,32 @@ class PublicGameMemory:
     
     def __init__(self, game_id: str):
         self.game_id = game_id
-        self.memory_id = str(uuid.uuid4())[:8]  # Short ID for reference
+        self.memory_id = secrets.token_hex(4)  # Short ID for reference
         
         # Chronological storage: List of PhaseRecords
         self.phase_history: List[PhaseRecord] = []
         self._current_phase: Optional[PhaseRecord] = None
         
         # Quick-access indices (for efficient lookups)
-        self._discussions_by_round: Dict[int, List[PhaseEvent]] = {}
+        self._discussions_by_round: Dict[int, _DiscussionColumns] = {}
         self._votes_by_round: Dict[int, Dict[str, str]] = {}  # round -> {voter: target}
         self._eliminations: List[Dict[str, Any]] = []  # chronological list
-        self._alive_by_round: Dict[int, List[str]] = {}  # round -> alive_agents
+        self._eliminations_by_round: Dict[int, List[Dict[str, Any]]] = {}
+        self._alive_by_round: Dict[int, Tuple[str, ...]] = {}  # round -> alive_agents
+        
+        # Rounds with discussions or votes, kept sorted as they are first seen
+        self._sorted_rounds: List[int] = []
+        self._rounds_seen: set = set()
         
         # Tracking
-        self.created_at = datetime.utcnow()
-        self.last_updated = datetime.utcnow()
+        self.created_at = self.last_updated = datetime.utcnow()
+        
+        # Rendered summaries, invalidated by the version counter bumped on every
+        # update; finished rounds keep their rendered lines until touched again
+        self._version = 0
+        self._summary_cache: OrderedDict[Tuple[int, Optional[int]], str] = OrderedDict()
+        self._round_lines: Dict[int, List[str]] = {}
+        self._snapshot: Optional[Tuple[int, Dict[str, Any]]] = None
     
     # =========================================================================
     # Phase Management
@@ -78,30 +137,34 @@ class PublicGameMemory:
     
     def start_phase(self, round_number: int, phase: str, alive_agents: List[str]) -> None:
         """Start a new phase, closing any previous phase."""
+        now = datetime.utcnow()
+        
         # Close previous phase
         if self._current_phase:
-            self._current_phase.ended_at = datetime.utcnow()
+            self._current_phase.ended_at = now
             self.phase_history.append(self._current_phase)
         
         # Create new phase record
         self._current_phase = PhaseRecord(
             round_number=round_number,
-            phase=phase
+            phase=phase,
+            started_at=now
         )
         
         # Track alive agents at start of this round
         if round_number not in self._alive_by_round:
-            self._alive_by_round[round_number] = alive_agents.copy()
+            self._alive_by_round[round_number] = tuple(alive_agents)
         
-        self._update_timestamp()
+        self._update_timestamp(now)
     
     def end_phase(self) -> None:
         """End the current phase."""
+        now = datetime.utcnow()
         if self._current_phase:
-            self._current_phase.ended_at = datetime.utcnow()
+            self._current_phase.ended_at = now
             self.phase_history.append(self._current_phase)
             self._current_phase = None
-        self._update_timestamp()
+        self._update_timestamp(now)
     
     # =========================================================================
     # Event Recording
@@ -127,14 +190,22 @@ class PublicGameMemory:
             targets: Who the discussion targets (for accuse/defend)
             subactions: List of discussion subactions used
         """
+        # Agent IDs and discussion types repeat across every event of a game,
+        # so intern them to share one string object per value
+        agent_id = sys.intern(agent_id)
+        discussion_type = sys.intern(discussion_type)
+        targets = [sys.intern(t) for t in targets] if targets else []
+        
+        now = datetime.utcnow()
         event = PhaseEvent(
             event_type="discussion",
             agent_id=agent_id,
             content=content,
             target_id=targets[0] if targets and len(targets) == 1 else None,
+            timestamp=now,
             metadata={
                 "discussion_type": discussion_type,
-                "targets": targets or [],
+                "targets": targets,
                 "subactions": subactions or []
             }
         )
@@ -145,17 +216,25 @@ class PublicGameMemory:
         
         # Add to quick-access index
         if round_number not in self._discussions_by_round:
-            self._discussions_by_round[round_number] = []
-        self._discussions_by_round[round_number].append(event)
+            self._discussions_by_round[round_number] = _DiscussionColumns()
+            self._track_round(round_number)
+        self._discussions_by_round[round_number].append(
+            agent_id, content, discussion_type, event.metadata["targets"], now
+        )
+        self._round_lines.pop(round_number, None)
         
-        self._update_timestamp()
+        self._update_timestamp(now)
     
     def add_vote(self, voter_id: str, target_id: str, round_number: int) -> None:
         """Record a vote."""
+        voter_id = sys.intern(voter_id)
+        target_id = sys.intern(target_id)
+        now = datetime.utcnow()
         event = PhaseEvent(
             event_type="vote",
             agent_id=voter_id,
-            target_id=target_id
+            target_id=target_id,
+            timestamp=now
         )
         
         # Add to current phase
@@ -165,9 +244,11 @@ class PublicGameMemory:
         # Add to quick-access index
         if round_number not in self._votes_by_round:
             self._votes_by_round[round_number] = {}
+            self._track_round(round_number)
         self._votes_by_round[round_number][voter_id] = target_id
+        self._round_lines.pop(round_number, None)
         
-        self._update_timestamp()
+        self._update_timestamp(now)
     
     def add_elimination(
         self,
@@ -185,29 +266,34 @@ class PublicGameMemory:
             method: How they were eliminated ("vote", "werewolf_kill", "witch_poison", "hunter_shot")
             phase: Which phase the elimination occurred in
         """
+        agent_id = sys.intern(agent_id)
+        now = datetime.utcnow()
         elimination = {
             "agent_id": agent_id,
             "round": round_number,
             "method": method,
             "phase": phase,
-            "timestamp": datetime.utcnow()
+            "timestamp": now
         }
         self._eliminations.append(elimination)
+        self._eliminations_by_round.setdefault(round_number, []).append(elimination)
+        self._round_lines.pop(round_number, None)
         
         event = PhaseEvent(
             event_type="elimination",
             agent_id=agent_id,
+            timestamp=now,
             metadata={"method": method, "round": round_number}
         )
         
         if self._current_phase:
             self._current_phase.events.append(event)
         
-        self._update_timestamp()
+        self._update_timestamp(now)
     
     def update_alive_agents(self, round_number: int, alive_agents: List[str]) -> None:
         """Update the list of alive agents for a round."""
-        self._alive_by_round[round_number] = alive_agents.copy()
+        self._alive_by_round[round_number] = tuple(alive_agents)
         self._update_timestamp()
     
     # =========================================================================
@@ -217,23 +303,31 @@ class PublicGameMemory:
     def get_all_discussions(self) -> List[Dict[str, Any]]:
         """Get all discussions from all rounds."""
         discussions = []
-        for round_num in sorted(self._discussions_by_round.keys()):
-            for event in self._discussions_by_round[round_num]:
+        for round_num in self._sorted_rounds:
+            columns = self._discussions_by_round.get(round_num)
+            if not columns:
+                continue
+            for agent_id, content, discussion_type, targets, timestamp in zip(
+                columns.agent_ids, columns.contents, columns.discussion_types,
+                columns.targets, columns.timestamps
+            ):
                 discussions.append({
                     "round": round_num,
-                    "agent_id": event.agent_id,
-                    "content": event.content,
-                    "discussion_type": event.metadata.get("discussion_type", "general"),
-                    "targets": event.metadata.get("targets", []),
-                    "timestamp": event.timestamp.isoformat()
+                    "agent_id": agent_id,
+                    "content": content,
+                    "discussion_type": discussion_type,
+                    "targets": targets,
+                    "timestamp": timestamp.isoformat()
                 })
         return discussions
     
     def get_all_votes(self) -> List[Dict[str, Any]]:
         """Get all votes from all rounds."""
         votes = []
-        for round_num in sorted(self._votes_by_round.keys()):
-            round_votes = self._votes_by_round[round_num]
+        for round_num in self._sorted_rounds:
+            round_votes = self._votes_by_round.get(round_num)
+            if not round_votes:
+                continue
             for voter, target in round_votes.items():
                 votes.append({
                     "round": round_num,
@@ -248,20 +342,24 @@ class PublicGameMemory:
     
     def get_round_discussions(self, round_number: int) -> List[Dict[str, Any]]:
         """Get discussions from a specific round."""
-        events = self._discussions_by_round.get(round_number, [])
+        columns = self._discussions_by_round.get(round_number)
+        if not columns:
+            return []
         return [
             {
-                "agent_id": e.agent_id,
-                "content": e.content,
-                "discussion_type": e.metadata.get("discussion_type", "general"),
-                "targets": e.metadata.get("targets", [])
+                "agent_id": agent_id,
+                "content": content,
+                "discussion_type": discussion_type,
+                "targets": targets
             }
-            for e in events
+            for agent_id, content, discussion_type, targets in zip(
+                columns.agent_ids, columns.contents, columns.discussion_types, columns.targets
+            )
         ]
     
-    def get_round_votes(self, round_number: int) -> Dict[str, str]:
-        """Get votes from a specific round."""
-        return self._votes_by_round.get(round_number, {}).copy()
+    def get_round_votes(self, round_number: int) -> Mapping[str, str]:
+        """Get a read-only view of the votes from a specific round."""
+        return MappingProxyType(self._votes_by_round.get(round_number, {}))
     
     # =========================================================================
     # Compact Summaries (for prompts)
@@ -276,13 +374,15 @@ class PublicGameMemory:
         Args:
             max_rounds: Limit to last N rounds (None = all rounds)
         """
+        key = (self._version, max_rounds)
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return cached
+        
         lines = []
         
         # Get rounds to include
-        all_rounds = sorted(set(
-            list(self._discussions_by_round.keys()) + 
-            list(self._votes_by_round.keys())
-        ))
+        all_rounds = self._sorted_rounds
         
         if max_rounds and len(all_rounds) > max_rounds:
             rounds = all_rounds[-max_rounds:]
@@ -291,45 +391,9 @@ class PublicGameMemory:
             rounds = all_rounds
         
         for round_num in rounds:
-            round_lines = [f"\nROUND {round_num}:"]
-            
-            # Discussions
-            discussions = self._discussions_by_round.get(round_num, [])
-            if discussions:
-                round_lines.append("  Discussions:")
-                for d in discussions:
-                    targets = d.metadata.get("targets", [])
-                    target_str = f" (targets: {','.join(targets)})" if targets else ""
-                    # Truncate long discussions
-                    content = d.content or ""
-                    if len(content) > 300:
-                        content = content[:297] + "..."
-                    round_lines.append(f"    {d.agent_id}{target_str}: \"{content}\"")
-            
-            # Votes
-            votes = self._votes_by_round.get(round_num, {})
-            if votes:
-                round_lines.append("  Votes:")
-                vote_counts = {}
-                for voter, target in votes.items():
-                    vote_counts[target] = vote_counts.get(target, 0) + 1
-                    round_lines.append(f"    {voter} -> {target}")
-                # Add vote summary
-                vote_summary = ", ".join([f"{t}:{c}" for t, c in sorted(vote_counts.items(), key=lambda x: -x[1])])
-                round_lines.append(f"    Summary: {vote_summary}")
-            
-            # Eliminations in this round
-            round_elims = [e for e in self._eliminations if e["round"] == round_num]
-            if round_elims:
-                round_lines.append("  Eliminated:")
-                for e in round_elims:
-                    # Only show public elimination methods
-                    # Vote eliminations are public
-                    # Hunter shots are public
-                    # Night deaths (werewolf kill/witch poison) are ambiguous - don't reveal method
-                    public_method = self._get_public_elimination_method(e['method'])
-                    round_lines.append(f"    {e['agent_id']} ({public_method})")
-            
+            round_lines = self._round_lines.get(round_num)
+            if round_lines is None:
+                round_lines = self._round_lines[round_num] = self._render_round(round_num)
             lines.extend(round_lines)
         
         # Current status
@@ -338,7 +402,11 @@ class PublicGameMemory:
             alive = self._alive_by_round[latest_round]
             lines.append(f"\nCurrent: {len(alive)} alive, {len(self._eliminations)} eliminated")
         
-        return "\n".join(lines) if lines else "No game history yet."
+        summary = "\n".join(lines) if lines else "No game history yet."
+        self._summary_cache[key] = summary
+        if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+            self._summary_cache.popitem(last=False)
+        return summary
     
     def get_memory_summary(self) -> str:
         """
@@ -354,12 +422,12 @@ class PublicGameMemory:
         lines = [f"Round {round_number} Summary:"]
         
         # Discussions
-        discussions = self._discussions_by_round.get(round_number, [])
+        discussions = self._discussions_by_round.get(round_number)
         if discussions:
             lines.append("  Discussions:")
-            for d in discussions:
-                content = (d.content or "")[:100]
-                lines.append(f"    - {d.agent_id}: {content}")
+            for agent_id, content in zip(discussions.agent_ids, discussions.contents):
+                content = (content or "")[:100]
+                lines.append(f"    - {agent_id}: {content}")
         
         # Votes
         votes = self._votes_by_round.get(round_number, {})
@@ -369,7 +437,7 @@ class PublicGameMemory:
                 lines.append(f"    - {voter} → {target}")
         
         # Eliminations
-        elims = [e for e in self._eliminations if e["round"] == round_number]
+        elims = self._eliminations_by_round.get(round_number)
         if elims:
             lines.append("  Eliminated:")
             for e in elims:
@@ -382,8 +450,14 @@ class PublicGameMemory:
     # =========================================================================
     
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize memory to dictionary for storage."""
-        return {
+        """Serialize memory to dictionary for storage.
+        
+        The result is shared by every caller until the memory changes, so it
+        must be treated as read-only.
+        """
+        if self._snapshot is not None and self._snapshot[0] == self._version:
+            return self._snapshot[1]
+        snapshot = {
             "game_id": self.game_id,
             "memory_id": self.memory_id,
             "discussions": self.get_all_discussions(),
@@ -393,6 +467,8 @@ class PublicGameMemory:
             "created_at": self.created_at.isoformat(),
             "last_updated": self.last_updated.isoformat()
         }
+        self._snapshot = (self._version, snapshot)
+        return snapshot
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PublicGameMemory':
@@ -404,30 +480,33 @@ class PublicGameMemory:
         for d in data.get("discussions", []):
             round_num = d["round"]
             if round_num not in memory._discussions_by_round:
-                memory._discussions_by_round[round_num] = []
-            memory._discussions_by_round[round_num].append(PhaseEvent(
-                event_type="discussion",
-                agent_id=d["agent_id"],
-                content=d["content"],
-                metadata={
-                    "discussion_type": d.get("discussion_type", "general"),
-                    "targets": d.get("targets", [])
-                }
-            ))
+                memory._discussions_by_round[round_num] = _DiscussionColumns()
+                memory._track_round(round_num)
+            timestamp = d.get("timestamp")
+            memory._discussions_by_round[round_num].append(
+                d["agent_id"],
+                d["content"],
+                d.get("discussion_type", "general"),
+                d.get("targets", []),
+                datetime.fromisoformat(timestamp) if timestamp else datetime.utcnow()
+            )
         
         # Restore votes
         for v in data.get("votes", []):
             round_num = v["round"]
             if round_num not in memory._votes_by_round:
                 memory._votes_by_round[round_num] = {}
+                memory._track_round(round_num)
             memory._votes_by_round[round_num][v["voter_id"]] = v["target_id"]
         
         # Restore eliminations
         memory._eliminations = data.get("eliminations", [])
+        for e in memory._eliminations:
+            memory._eliminations_by_round.setdefault(e["round"], []).append(e)
         
         # Restore alive status
         memory._alive_by_round = {
-            int(k): v for k, v in data.get("alive_by_round", {}).items()
+            int(k): tuple(v) for k, v in data.get("alive_by_round", {}).items()
         }
         
         return memory
@@ -457,7 +536,56 @@ class PublicGameMemory:
             # Don't reveal the method - just show they were eliminated
             return "eliminated"
     
-    def _update_timestamp(self) -> None:
-        """Update the last modified timestamp."""
-        self.last_updated = datetime.utcnow()
+    def _track_round(self, round_number: int) -> None:
+        """Insert a round into the sorted round list the first time it is seen."""
+        if round_number not in self._rounds_seen:
+            self._rounds_seen.add(round_number)
+            bisect.insort(self._sorted_rounds, round_number)
+    
+    def _render_round(self, round_num: int) -> List[str]:
+        """Render the compact summary lines for a single round."""
+        round_lines = [f"\nROUND {round_num}:"]
+        
+        # Discussions
+        discussions = self._discussions_by_round.get(round_num)
+        if discussions:
+            round_lines.append("  Discussions:")
+            for agent_id, preview, targets in zip(
+                discussions.agent_ids, discussions.previews, discussions.targets
+            ):
+                target_str = f" (targets: {','.join(targets)})" if targets else ""
+                round_lines.append(f"    {agent_id}{target_str}: \"{preview}\"")
+        
+        # Votes
+        votes = self._votes_by_round.get(round_num, {})
+        if votes:
+            round_lines.append("  Votes:")
+            for voter, target in votes.items():
+                round_lines.append(f"    {voter} -> {target}")
+            # Add vote summary (most_common keeps first-seen order for ties)
+            vote_summary = ", ".join(f"{t}:{c}" for t, c in Counter(votes.values()).most_common())
+            round_lines.append(f"    Summary: {vote_summary}")
+        
+        # Eliminations in this round
+        round_elims = self._eliminations_by_round.get(round_num)
+        if round_elims:
+            round_lines.append("  Eliminated:")
+            for e in round_elims:
+                # Only show public elimination methods
+                # Vote eliminations are public
+                # Hunter shots are public
+                # Night deaths (werewolf kill/witch poison) are ambiguous - don't reveal method
+                public_method = self._get_public_elimination_method(e['method'])
+                round_lines.append(f"    {e['agent_id']} ({public_method})")
+        
+        return round_lines
+    
+    def _update_timestamp(self, now: Optional[datetime] = None) -> None:
+        """Update the last modified timestamp and invalidate cached summaries.
+        
+        Recorders pass the time they already stamped on their event so each
+        update reads the clock once.
+        """
+        self._version += 1
+        self.last_updated = now or datetime.utcnow()
 
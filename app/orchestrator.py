@@ -1,21 +1,24 @@
 """Game orchestration via A2A SDK with enhanced prompt building and information hiding."""
 
 import asyncio
+import contextlib
 import logging
+import os
 import time
 import random
-from typing import List, Dict, Optional, Any, Iterator
-from datetime import datetime
-import json
+import uuid
+from typing import List, Dict, Optional, Any, Iterator, Tuple
+from datetime import datetime, timedelta
 
 import httpx
+import orjson
 from a2a.client import A2AClient
 from a2a.types import (
     SendMessageRequest, MessageSendParams, Message,
     Part, TextPart, Role
 )
 
-from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ValidationError
 
 from app.types.agent import (
     WerewolfAction, AgentProfile, AgentResponse,
@@ -26,6 +29,7 @@ from app.game.engine import GameEngine
 from app.logging.storage import GameLogger
 from app.prompts.builder import PromptBuilder
 from app.memory.public_memory import PublicGameMemory
+from extract_game_metrics import extract_game_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +38,64 @@ logger = logging.getLogger(__name__)
 # MAX_GAME_ROUNDS removed - games can now run to completion without round limits
 MAX_DISCUSSION_TURNS = 1  # Each agent speaks once per discussion round
 
+# Connection pool shared by all agent clients. Agents sit idle while the others
+# take their turns, so idle connections are kept well past httpx's 5 s default
+# to avoid a fresh TCP/TLS handshake on most calls.
+AGENT_HTTP_LIMITS = httpx.Limits(
+    max_connections=256,
+    max_keepalive_connections=64,
+    keepalive_expiry=120.0
+)
+
+# Upper bound on opening agent connections before the first phase, so an
+# unreachable agent doesn't hold up the game loop
+PREWARM_TIMEOUT = 5.0
+
+# Actions newer than this count towards the current phase
+PHASE_ACTION_WINDOW = timedelta(seconds=300)
+
+# How long the game loop waits before re-running a phase that did not advance
+PHASE_RETRY_DELAY = 1.0
+
+# Actions offered to agents, by phase and (for night phases) by role
+_PASS_ONLY = ("pass",)
+_PHASE_ACTIONS: Dict[GamePhase, Tuple[str, ...]] = {
+    GamePhase.DAY_DISCUSSION: ("discuss", "pass"),
+    GamePhase.DAY_VOTING: ("vote",),
+}
+_ROLE_PHASE_ACTIONS: Dict[Tuple[GamePhase, AgentRole], Tuple[str, ...]] = {
+    (GamePhase.NIGHT_WEREWOLF, AgentRole.WEREWOLF): ("kill", "pass"),
+    (GamePhase.NIGHT_SEER, AgentRole.SEER): ("investigate", "pass"),
+    (GamePhase.NIGHT_DOCTOR, AgentRole.DOCTOR): ("protect", "pass"),
+    (GamePhase.NIGHT_WITCH, AgentRole.WITCH): ("heal", "poison", "pass"),
+}
+
+# The single role that acts in each night phase; every alive agent acts by day
+_NIGHT_PHASE_ROLES: Dict[GamePhase, str] = {
+    GamePhase.NIGHT_WEREWOLF: AgentRole.WEREWOLF.value,
+    GamePhase.NIGHT_WITCH: AgentRole.WITCH.value,
+    GamePhase.NIGHT_SEER: AgentRole.SEER.value,
+    GamePhase.NIGHT_DOCTOR: AgentRole.DOCTOR.value,
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-native types that can appear in agent task data."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _raw_llm_text_from_json(text: str) -> Optional[str]:
+    """Pull action.metadata.raw_llm_text out of an agent response body, if present."""
+    try:
+        response_data = orjson.loads(text)
+        return response_data["action"]["metadata"].get("raw_llm_text")
+    except (orjson.JSONDecodeError, KeyError, TypeError, AttributeError):
+        return None
+
 
 class GameOrchestrator:
     """Orchestrates Werewolf games between white agents via A2A with enhanced prompt building."""
@@ -41,23 +103,35 @@ class GameOrchestrator:
     def __init__(
         self,
         storage: GameLogger,
-        httpx_client: Optional[httpx.AsyncClient] = None
+        httpx_client: Optional[httpx.AsyncClient] = None,
+        prewarm_connections: bool = True,
+        compute_metrics: Optional[bool] = None
     ):
         """
         Initialize the orchestrator.
 
         Args:
             storage: Game logger for data persistence
+            httpx_client: HTTP client shared by all agent clients (created if None)
+            prewarm_connections: Open a pooled connection to every agent before
+                the first phase of each game
+            compute_metrics: Calculate evaluation metrics when a game ends
+                (if None, uses EVAL_METRICS; on unless set to 0/false/no)
         """
         self.storage = storage
         self.engine = GameEngine()
-        self.agent_clients: Dict[str, A2AClient] = {}
+        # Keyed by (game_id, agent_id): agent IDs repeat across concurrent games
+        self.agent_clients: Dict[Tuple[str, str], A2AClient] = {}
         # Set high timeout for LLM calls (5 minutes) - LLM responses can take time
         # Connect timeout: 60 seconds (for slow network connections)
         # Total timeout: 300 seconds (5 minutes for full LLM response)
         timeout = httpx.Timeout(300.0, connect=60.0)
-        self.httpx_client = httpx_client or httpx.AsyncClient(timeout=timeout)
+        self.httpx_client = httpx_client or httpx.AsyncClient(timeout=timeout, limits=AGENT_HTTP_LIMITS)
         self._owns_httpx_client = httpx_client is None
+        self.prewarm_connections = prewarm_connections
+        if compute_metrics is None:
+            compute_metrics = os.getenv("EVAL_METRICS", "").lower() not in ("0", "false", "no")
+        self.compute_metrics = compute_metrics
         
         # Track discussion context for sequential discussion
         self.discussion_context: Dict[str, List[Dict[str, Any]]] = {}
@@ -67,6 +141,15 @@ class GameOrchestrator:
         
         # Public memory for each game (shared across all agents)
         self.public_memories: Dict[str, PublicGameMemory] = {}
+        
+        # Caps concurrent agent requests per game (GameConfig.max_concurrent_requests)
+        self.request_semaphores: Dict[str, asyncio.Semaphore] = {}
+        
+        # Per-game RNG, seeded from GameConfig.seed so games can be replayed
+        self.game_rngs: Dict[str, random.Random] = {}
+        
+        # Agent profiles grouped by role; roles are fixed once a game is created
+        self.agents_by_role: Dict[str, Dict[str, List[AgentProfile]]] = {}
 
     async def start_game(
         self,
@@ -90,7 +173,11 @@ class GameOrchestrator:
             config = GameConfig()
         # max_rounds is now optional (None = no limit)
         
-        game_state = self.engine.create_game(agent_urls, config)
+        seed = config.seed if config.seed is not None else time.time_ns()
+        rng = random.Random(seed)
+        game_state = self.engine.create_game(agent_urls, config, rng)
+        self.game_rngs[game_state.game_id] = rng
+        logger.info(f"Game {game_state.game_id} seed: {seed}")
 
         agents = []
         for i, url in enumerate(agent_urls):
@@ -110,7 +197,7 @@ class GameOrchestrator:
                 model=model
             )
             agents.append(agent)
-            self.agent_clients[agent_id] = A2AClient(
+            self.agent_clients[(game_state.game_id, agent_id)] = A2AClient(
                 httpx_client=self.httpx_client,
                 url=url
             )
@@ -121,7 +208,7 @@ class GameOrchestrator:
             if role == AgentRole.WEREWOLF.value
         ]
         if werewolves:
-            self.werewolf_decision_makers[game_state.game_id] = random.choice(werewolves)
+            self.werewolf_decision_makers[game_state.game_id] = rng.choice(werewolves)
             logger.info(f"Werewolf decision maker: {self.werewolf_decision_makers[game_state.game_id]}")
         
         # Initialize public memory for this game
@@ -130,6 +217,11 @@ class GameOrchestrator:
             game_state.round_number, game_state.alive_agent_ids
         )
         logger.info(f"Initialized public memory for game {game_state.game_id}")
+        
+        self.request_semaphores[game_state.game_id] = asyncio.Semaphore(config.max_concurrent_requests)
+        self.agents_by_role[game_state.game_id] = self._group_agents_by_role(
+            agents, game_state.role_assignments
+        )
 
         self.storage.log_game_created(game_state, agent_urls)
         self.storage.save_agents(game_state.game_id, agents)
@@ -138,14 +230,35 @@ class GameOrchestrator:
         self.storage.log_game_started(game_state.game_id)
         self.storage.save_game(game_state, force_log=True)
 
-        asyncio.create_task(self._run_game_loop(game_state.game_id))
+        asyncio.create_task(self._run_game_loop(game_state.game_id, agent_urls))
 
         logger.info(f"Started game {game_state.game_id} with {len(agents)} agents")
         return game_state.game_id
 
-    async def _run_game_loop(self, game_id: str):
+    async def _prewarm_connections(self, agent_urls: List[str]) -> None:
+        """Open keep-alive connections to all agents concurrently.
+
+        Only the TCP/TLS setup matters, so any response status (or error) is
+        ignored; the first phase then reuses the pooled connections instead of
+        paying a handshake per agent.
+        """
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(self.httpx_client.head(url) for url in agent_urls),
+                    return_exceptions=True
+                ),
+                timeout=PREWARM_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.debug("Timed out pre-warming agent connections")
+
+    async def _run_game_loop(self, game_id: str, agent_urls: Optional[List[str]] = None):
         """Main game loop that manages phases and agent interactions."""
         try:
+            if agent_urls and self.prewarm_connections:
+                await self._prewarm_connections(agent_urls)
+
             while True:
                 game_state = self.storage.get_game(game_id)
                 if not game_state or game_state.status == GameStatus.COMPLETED:
@@ -172,7 +285,9 @@ class GameOrchestrator:
                     if public_memory:
                         public_memory.end_phase()
                     
-                    game_state, eliminated = self.engine.advance_phase(game_state, phase_actions)
+                    game_state, eliminated = self.engine.advance_phase(
+                        game_state, phase_actions, rng=self.game_rngs.get(game_id)
+                    )
                     
                     # Update public memory after phase change
                     if public_memory:
@@ -247,21 +362,22 @@ class GameOrchestrator:
                         self.storage.save_game(game_state, force_log=True)
                         await self._finalize_game(game_id)
                         break
-
-                await asyncio.sleep(1)
+                else:
+                    # Still waiting on actions; an advanced phase runs straight away
+                    await asyncio.sleep(PHASE_RETRY_DELAY)
 
         except asyncio.CancelledError:
             # Normal cancellation (e.g., Ctrl+C) - don't mark game as cancelled
             logger.info(f"Game loop for {game_id} was cancelled (normal interruption)")
             raise  # Re-raise to allow proper cleanup
         except Exception as e:
-            logger.error(f"Error in game loop for {game_id}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error in game loop for {game_id}: {e}")
             game_state = self.storage.get_game(game_id)
             if game_state:
                 game_state.status = GameStatus.CANCELLED
                 self.storage.save_game(game_state)
+        finally:
+            await self._release_game(game_id)
 
     def _force_game_end(self, game_state: GameState) -> GameState:
         """Force game to end when max rounds reached."""
@@ -499,19 +615,20 @@ class GameOrchestrator:
         decision_maker_id = self.werewolf_decision_makers.get(game_id)
         
         # If decision maker is dead, select new one from alive werewolves
-        alive_werewolves = [w for w in werewolves if w.agent_id in game_state.alive_agent_ids]
+        alive_ids = set(game_state.alive_agent_ids)
+        alive_werewolves = {w.agent_id: w for w in werewolves if w.agent_id in alive_ids}
         
         if not alive_werewolves:
             logger.warning(f"No alive werewolves in game {game_id}")
             return
         
-        if not decision_maker_id or decision_maker_id not in [w.agent_id for w in alive_werewolves]:
-            decision_maker_id = random.choice([w.agent_id for w in alive_werewolves])
+        if not decision_maker_id or decision_maker_id not in alive_werewolves:
+            decision_maker_id = (self.game_rngs.get(game_id) or random).choice(list(alive_werewolves))
             self.werewolf_decision_makers[game_id] = decision_maker_id
             logger.info(f"New werewolf decision maker: {decision_maker_id}")
         
         # Get decision from decision maker
-        decision_maker = next((w for w in alive_werewolves if w.agent_id == decision_maker_id), None)
+        decision_maker = alive_werewolves.get(decision_maker_id)
         
         if decision_maker:
             decision_action = await self._request_agent_action(
@@ -523,7 +640,7 @@ class GameOrchestrator:
                 target = decision_action.target_agent_id
                 
                 # Other werewolves automatically agree
-                for werewolf in alive_werewolves:
+                for werewolf in alive_werewolves.values():
                     if werewolf.agent_id != decision_maker_id:
                         # Create agreeing action
                         agree_action = WerewolfAction(
@@ -580,7 +697,7 @@ class GameOrchestrator:
         # Get visible state (for backwards compatibility)
         visible_state = self.engine.get_agent_view(game_state, agent.agent_id, self.storage)
 
-        client = self.agent_clients.get(agent.agent_id)
+        client = self.agent_clients.get((game_id, agent.agent_id))
         if not client:
             logger.error(f"No A2A client found for agent {agent.agent_id}")
             return None
@@ -611,8 +728,6 @@ class GameOrchestrator:
         if game_state.phase == GamePhase.DAY_VOTING:
             task_data["current_votes"] = game_state.current_votes
 
-        start_time = time.time()
-
         # Log the prompt being sent (Deep Debug)
         self.storage.log_agent_prompt(
             game_id=game_id,
@@ -623,26 +738,39 @@ class GameOrchestrator:
         )
 
         try:
+            # Parallel phases send several requests within the same clock tick,
+            # so IDs must not be derived from the time
+            request_id = uuid.uuid4().hex
             message = Message(
-                message_id=str(time.time()),
+                message_id=request_id,
                 role=Role.user,
                 parts=[
                     TextPart(
                         kind="text",
-                        text=json.dumps(jsonable_encoder(task_data)),
+                        text=orjson.dumps(
+                            task_data, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+                        ).decode(),
                     )
                 ]
             )
 
             request = SendMessageRequest(
-                id=str(time.time()),
+                id=request_id,
                 jsonrpc="2.0",
                 method="message/send",
                 params=MessageSendParams(message=message)
             )
 
-            response = await client.send_message(request)
-            response_time = (time.time() - start_time) * 1000
+            queued_at = time.perf_counter()
+            async with self.request_semaphores.get(game_id) or contextlib.nullcontext():
+                # Time only the agent's round trip, not the wait for a request slot
+                start_time = time.perf_counter()
+                response = await client.send_message(request)
+                response_time = (time.perf_counter() - start_time) * 1000
+
+            logger.debug(
+                f"Agent {agent.agent_id} request waited {(start_time - queued_at) * 1000:.2f}ms for a slot"
+            )
 
             logger.debug(
                 f"Agent {agent.agent_id} responded in {response_time:.2f}ms"
@@ -672,19 +800,8 @@ class GameOrchestrator:
                 if response.root.result:
                     result = response.root.result
                     for part_text in self._iter_response_text_parts(result):
-                        # Extract raw LLM text from metadata if available
-                        try:
-                            response_data = json.loads(part_text)
-                            raw_llm_text = None
-                            if isinstance(response_data, dict):
-                                action_meta = response_data.get("action", {}).get("metadata", {})
-                                raw_llm_text = action_meta.get("raw_llm_text")
-                        except:
-                            raw_llm_text = None
-                        
                         # Log raw response (Deep Debug)
                         # part_text is the JSON response from White Agent
-                        # If raw_llm_text is available, log it separately
                         self.storage.log_agent_response(
                             game_id=game_id,
                             agent_id=agent.agent_id,
@@ -694,35 +811,37 @@ class GameOrchestrator:
                             response_time_ms=response_time
                         )
                         
-                        # Also log raw LLM text if available (before JSON formatting)
-                        if raw_llm_text:
-                            self.storage._write_game_event(game_id, {
-                                "event": "DEBUG_raw_llm_text",
-                                "timestamp": datetime.utcnow().isoformat(),
-                                "game_id": game_id,
-                                "agent_id": agent.agent_id,
-                                "phase": game_state.phase.value,
-                                "round_number": game_state.round_number,
-                                "raw_llm_text": raw_llm_text,
-                                "response_time_ms": response_time
-                            })
-                        
+                        # Validate straight from the JSON text instead of
+                        # decoding to a dict first
                         try:
-                            response_data = json.loads(part_text)
-                        except json.JSONDecodeError as decode_error:
-                            logger.error(
-                                f"Failed to decode agent response JSON: {decode_error}"
+                            agent_response = AgentResponse.model_validate_json(part_text)
+                        except ValidationError as parse_error:
+                            # Only a rejected response needs a separate decode
+                            # to recover the raw LLM text for debugging
+                            self._log_raw_llm_text(
+                                game_id, agent.agent_id, game_state,
+                                _raw_llm_text_from_json(part_text), response_time
                             )
-                            self._handle_invalid_response(game_id, agent.agent_id, part_text, "JSON decode error")
+                            if parse_error.errors()[0]["type"] == "json_invalid":
+                                logger.error(
+                                    f"Failed to decode agent response JSON: {parse_error}"
+                                )
+                                self._handle_invalid_response(game_id, agent.agent_id, part_text, "JSON decode error")
+                            else:
+                                logger.error(f"Failed to parse agent response: {parse_error}")
+                                self._handle_invalid_response(game_id, agent.agent_id, part_text, str(parse_error))
                             continue
-
-                        try:
-                            agent_response = AgentResponse(**response_data)
                         except Exception as parse_error:
                             logger.error(f"Failed to parse agent response: {parse_error}")
                             self._handle_invalid_response(game_id, agent.agent_id, part_text, str(parse_error))
                             continue
 
+                        # Also log raw LLM text if available (before JSON formatting)
+                        self._log_raw_llm_text(
+                            game_id, agent.agent_id, game_state,
+                            agent_response.action.metadata.get("raw_llm_text"), response_time
+                        )
+
                         action = agent_response.action
                         action.agent_id = agent.agent_id
                         
@@ -740,7 +859,7 @@ class GameOrchestrator:
                             tool_call_info = action.metadata["tool_calls"]
                             self.storage._write_game_event(game_id, {
                                 "event": "DEBUG_tool_calls",
-                                "timestamp": datetime.utcnow().isoformat(),
+                                "timestamp": datetime.utcnow(),
                                 "game_id": game_id,
                                 "agent_id": agent.agent_id,
                                 "phase": game_state.phase.value,
@@ -776,21 +895,34 @@ class GameOrchestrator:
             self._handle_agent_error(game_id, agent.agent_id, str(e))
             return None
 
-    def _get_valid_actions_for_phase(self, phase: GamePhase, role: AgentRole) -> List[str]:
-        """Get list of valid actions for the current phase and role."""
-        if phase == GamePhase.DAY_DISCUSSION:
-            return ["discuss", "pass"]
-        elif phase == GamePhase.DAY_VOTING:
-            return ["vote"]
-        elif phase == GamePhase.NIGHT_WEREWOLF:
-            return ["kill", "pass"] if role == AgentRole.WEREWOLF else ["pass"]
-        elif phase == GamePhase.NIGHT_SEER:
-            return ["investigate", "pass"] if role == AgentRole.SEER else ["pass"]
-        elif phase == GamePhase.NIGHT_DOCTOR:
-            return ["protect", "pass"] if role == AgentRole.DOCTOR else ["pass"]
-        elif phase == GamePhase.NIGHT_WITCH:
-            return ["heal", "poison", "pass"] if role == AgentRole.WITCH else ["pass"]
-        return ["pass"]
+    def _log_raw_llm_text(
+        self,
+        game_id: str,
+        agent_id: str,
+        game_state: GameState,
+        raw_llm_text: Optional[str],
+        response_time: float
+    ):
+        """Log the agent's raw LLM text (Deep Debug), if it sent any."""
+        if not raw_llm_text:
+            return
+        self.storage._write_game_event(game_id, {
+            "event": "DEBUG_raw_llm_text",
+            "timestamp": datetime.utcnow(),
+            "game_id": game_id,
+            "agent_id": agent_id,
+            "phase": game_state.phase.value,
+            "round_number": game_state.round_number,
+            "raw_llm_text": raw_llm_text,
+            "response_time_ms": response_time
+        })
+
+    def _get_valid_actions_for_phase(self, phase: GamePhase, role: AgentRole) -> Tuple[str, ...]:
+        """Get the valid actions for the current phase and role."""
+        actions = _ROLE_PHASE_ACTIONS.get((phase, role))
+        if actions is None:
+            actions = _PHASE_ACTIONS.get(phase, _PASS_ONLY)
+        return actions
 
     def _handle_agent_error(self, game_id: str, agent_id: str, error: str):
         """Handle agent errors by logging and creating a pass action."""
@@ -859,7 +991,11 @@ class GameOrchestrator:
         success, error_msg = self.engine.process_action(game_state, action)
 
         if success:
-            self.storage.save_action(game_id, action, game_state.round_number)
+            # Stamp acceptance time here rather than trusting the agent-supplied
+            # timestamp, so stored actions stay in timestamp order for
+            # _get_phase_actions
+            action.timestamp = datetime.utcnow()
+            self.storage.save_action(game_id, action, game_state.round_number, game_state)
             self.storage.save_game(game_state)
             logger.debug(f"Processed action from {action.agent_id}: {action.action_type}")
             
@@ -896,7 +1032,7 @@ class GameOrchestrator:
                 fallback = WerewolfAction(
                     agent_id=agent_id,
                     action_type=ActionType.VOTE,
-                    target_agent_id=random.choice(valid_targets),
+                    target_agent_id=(self.game_rngs.get(game_id) or random).choice(valid_targets),
                     reasoning=f"Fallback vote due to invalid action: {error_msg}",
                     confidence=0.1
                 )
@@ -914,7 +1050,7 @@ class GameOrchestrator:
         # Process the fallback action
         success, _ = self.engine.process_action(game_state, fallback)
         if success:
-            self.storage.save_action(game_id, fallback, game_state.round_number)
+            self.storage.save_action(game_id, fallback, game_state.round_number, game_state)
             self.storage.save_game(game_state)
             logger.info(f"Applied fallback action for {agent_id}: {fallback.action_type}")
 
@@ -924,39 +1060,44 @@ class GameOrchestrator:
         agents: List[AgentProfile]
     ) -> List[AgentProfile]:
         """Get list of agents that should act in the current phase."""
-        active = []
-
+        alive_ids = set(game_state.alive_agent_ids)
+
+        if game_state.phase in (GamePhase.DAY_DISCUSSION, GamePhase.DAY_VOTING):
+            return [agent for agent in agents if agent.agent_id in alive_ids]
+
+        role = _NIGHT_PHASE_ROLES.get(game_state.phase)
+        if role is None:
+            return []
+
+        by_role = self.agents_by_role.get(game_state.game_id)
+        if by_role is None:
+            by_role = self._group_agents_by_role(agents, game_state.role_assignments)
+        return [agent for agent in by_role.get(role, ()) if agent.agent_id in alive_ids]
+
+    @staticmethod
+    def _group_agents_by_role(
+        agents: List[AgentProfile],
+        role_assignments: Dict[str, str]
+    ) -> Dict[str, List[AgentProfile]]:
+        """Group agent profiles by their assigned role value."""
+        by_role: Dict[str, List[AgentProfile]] = {}
         for agent in agents:
-            if agent.agent_id not in game_state.alive_agent_ids:
-                continue
-
-            role = game_state.role_assignments.get(agent.agent_id)
-
-            if game_state.phase in [GamePhase.DAY_DISCUSSION, GamePhase.DAY_VOTING]:
-                active.append(agent)
-            elif game_state.phase == GamePhase.NIGHT_WEREWOLF:
-                if role == AgentRole.WEREWOLF.value:
-                    active.append(agent)
-            elif game_state.phase == GamePhase.NIGHT_WITCH:
-                if role == AgentRole.WITCH.value:
-                    active.append(agent)
-            elif game_state.phase == GamePhase.NIGHT_SEER:
-                if role == AgentRole.SEER.value:
-                    active.append(agent)
-            elif game_state.phase == GamePhase.NIGHT_DOCTOR:
-                if role == AgentRole.DOCTOR.value:
-                    active.append(agent)
-
-        return active
+            by_role.setdefault(role_assignments.get(agent.agent_id), []).append(agent)
+        return by_role
 
     def _get_phase_actions(self, game_id: str) -> List[WerewolfAction]:
-        """Get all actions from the current phase."""
+        """Get all actions from the current phase.
+
+        Actions are stored in the order they were accepted and stamped with the
+        acceptance time, so only the tail inside PHASE_ACTION_WINDOW is walked
+        instead of the whole history.
+        """
         all_actions = self.storage.get_game_actions(game_id)
-        recent_actions = [
-            a for a in all_actions
-            if (datetime.utcnow() - a.timestamp).total_seconds() < 300
-        ]
-        return recent_actions
+        cutoff = datetime.utcnow() - PHASE_ACTION_WINDOW
+        start = len(all_actions)
+        while start and all_actions[start - 1].timestamp > cutoff:
+            start -= 1
+        return all_actions[start:]
     
     def _determine_elimination_method(
         self,
@@ -1034,62 +1175,75 @@ class GameOrchestrator:
         )
 
         # Log comprehensive game completion
-        self.storage.log_game_completed(game_state)
-        self.storage.log_game_ended(game_id, game_state.winner, game_state.round_number)
+        self.storage.log_game_completed(game_state, flush=False)
+        self.storage.log_game_ended(
+            game_id, game_state.winner, game_state.round_number, release=False
+        )
+        # Wait for the whole game to reach disk without blocking other games
+        await asyncio.to_thread(self.storage.flush, game_id)
+
+        if self.compute_metrics:
+            await self._record_evaluation_metrics(game_id, game_state)
+
+        await self._release_game(game_id)
+
+        logger.info(f"Game {game_id} finalized and cleaned up")
 
+    async def _record_evaluation_metrics(self, game_id: str, game_state: GameState):
+        """Calculate the finished game's evaluation metrics and log them as an event."""
         # Calculate and store evaluation scores
         # Note: Most metrics don't require a winner - they're based on actions, discussions, etc.
         # Only the 'winner' field itself will be None for games that hit max rounds
         try:
-            from extract_game_metrics import extract_game_metrics
-            import os
-            
-            # Use custom name if available from storage, otherwise use game_id
-            file_name = self.storage.game_name if hasattr(self.storage, 'game_name') and self.storage.game_name else game_id
-            game_log_path = f"game_logs/baseline/game_{file_name}.jsonl"
-            if os.path.exists(game_log_path):
-                logger.info(f"Calculating metrics for game {game_id}")
-                metrics = extract_game_metrics(game_log_path)
-                
+            # The file the logger actually writes to: honours its log_dir, game
+            # name, compression and shared-file settings
+            game_log_path = self.storage._get_log_path(game_id)
+            logger.info(f"Calculating metrics for game {game_id}")
+            try:
+                # Reads the whole log, so keep it off the event loop
+                metrics = await asyncio.to_thread(extract_game_metrics, game_log_path, game_id)
+            except FileNotFoundError:
+                logger.warning(f"Game log not found for metrics calculation: {game_log_path}")
+            else:
                 # Ensure winner field matches game state (will be None for max-round games)
                 metrics["winner"] = game_state.winner
-                
+            
                 self.storage._write_game_event(game_id, {
                     "event": "evaluation_metrics",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": datetime.utcnow(),
                     "game_id": game_id,
                     "metrics": metrics
                 })
-                
+            
                 if game_state.winner is None:
                     logger.info(f"Game {game_id} metrics calculated (no winner - max rounds reached)")
                 else:
                     logger.info(f"Game {game_id} evaluation completed with {len(metrics)} metrics")
-            else:
-                logger.warning(f"Game log not found for metrics calculation: {game_log_path}")
         except Exception as e:
-            logger.error(f"Failed to calculate metrics for game {game_id}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Failed to calculate metrics for game {game_id}: {e}")
 
-        # Clean up discussion context
-        if game_id in self.discussion_context:
-            del self.discussion_context[game_id]
-        
-        # Clean up werewolf decision maker
-        if game_id in self.werewolf_decision_makers:
-            del self.werewolf_decision_makers[game_id]
-        
-        # Clean up public memory
-        if game_id in self.public_memories:
-            del self.public_memories[game_id]
+    async def _release_game(self, game_id: str):
+        """
+        Drop a game's per-game orchestrator state, agent clients and log descriptor.
+
+        Safe to call more than once; the game loop calls it on every exit path so
+        games that crash or are cancelled before finalizing don't leak entries.
+        """
+        self.discussion_context.pop(game_id, None)
+        self.werewolf_decision_makers.pop(game_id, None)
+        self.public_memories.pop(game_id, None)
+        self.request_semaphores.pop(game_id, None)
+        self.game_rngs.pop(game_id, None)
+        self.agents_by_role.pop(game_id, None)
 
         # Clean up agent clients
-        for agent_id in list(self.agent_clients.keys()):
-            if agent_id in game_state.agent_ids:
-                self.agent_clients.pop(agent_id, None)
+        game_state = self.storage.get_game(game_id)
+        if game_state:
+            for agent_id in game_state.agent_ids:
+                self.agent_clients.pop((game_id, agent_id), None)
 
-        logger.info(f"Game {game_id} finalized and cleaned up")
+        # Flush and release the game's log file descriptor off the event loop
+        await asyncio.to_thread(self.storage.close_game, game_id)
 
     async def close(self):
         """Clean up resources."""
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import random
 from typing import Any, Dict, Iterable, Optional, Sequence
 from uuid import uuid4
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+import orjson
 import uvicorn
 
 from app.types.agent import ActionType, AgentRole, DiscussionActionType
@@ -297,6 +297,11 @@ def _build_action_payload(
     }
 
 
+def _json_response(payload: Dict[str, Any], status_code: int = 200) -> Response:
+    """Return a JSON-RPC payload serialized with orjson."""
+    return Response(orjson.dumps(payload), status_code=status_code, media_type="application/json")
+
+
 def create_dummy_agent_app(agent_name: str) -> FastAPI:
     """Create a FastAPI application that emulates a basic white agent."""
     app = FastAPI(title=f"Dummy Agent {agent_name}")
@@ -307,13 +312,13 @@ def create_dummy_agent_app(agent_name: str) -> FastAPI:
 
     @app.post("/")
     async def handle_message(request: Request):
-        payload = await request.json()
+        payload = orjson.loads(await request.body())
         method = payload.get("method")
         request_id = payload.get("id")
 
         if method != "message/send":
             logger.warning("Unsupported method %s", method)
-            return JSONResponse(
+            return _json_response(
                 {
                     "jsonrpc": "2.0",
                     "id": request_id,
@@ -332,8 +337,8 @@ def create_dummy_agent_app(agent_name: str) -> FastAPI:
         task_payload: Dict[str, Any] = {}
         if text_parts and text_parts[0]:
             try:
-                task_payload = json.loads(text_parts[0])
-            except json.JSONDecodeError as exc:
+                task_payload = orjson.loads(text_parts[0])
+            except orjson.JSONDecodeError as exc:
                 logger.error("Failed to decode task payload: %s", exc)
 
         response_payload = _build_action_payload(agent_name, task_payload)
@@ -344,12 +349,12 @@ def create_dummy_agent_app(agent_name: str) -> FastAPI:
             "parts": [
                 {
                     "kind": "text",
-                    "text": json.dumps(response_payload),
+                    "text": orjson.dumps(response_payload).decode(),
                 }
             ],
         }
 
-        return JSONResponse(
+        return _json_response(
             {
                 "jsonrpc": "2.0",
                 "id": request_id,
@@ -37,6 +37,8 @@ class GameConfig(BaseModel):
     discussion_time_limit: int = Field(300, description="Time limit for discussion in seconds")
     voting_time_limit: int = Field(60, description="Time limit for voting in seconds")
     max_rounds: Optional[int] = Field(None, description="Maximum number of rounds before game ends (None = no limit)")
+    max_concurrent_requests: int = Field(8, ge=1, description="Maximum agent requests in flight at once")
+    seed: Optional[int] = Field(None, description="Seed for role assignment and other random choices (None = time-based)")
 
 
 class RoundRecord(BaseModel):
@@ -4,34 +4,78 @@ Extract game metrics from a JSONL game log file.
 Only extracts metrics specified in the agent-level metric specification.
 """
 
+import io
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional
 from collections import defaultdict
 import statistics
 
+import orjson
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for compressed game logs
+    zstandard = None
+
 # Add the app directory to the path
 ROOT_DIR = Path(__file__).resolve().parents[0]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+# Events the metric calculators read; everything else (prompts, raw LLM text,
+# other debug events) is dropped as the log is streamed
+METRIC_EVENTS = frozenset({
+    "game_created", "agents_assigned", "game_update", "game_completed",
+    "action", "invalid_action",
+})
 
-def extract_game_metrics(game_log_path: str) -> Dict[str, Any]:
-    """Extract metrics from a game log file."""
-    
-    # Read the game log
-    with open(game_log_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    # Parse events
-    events = []
-    for line in lines:
-        try:
-            event = json.loads(line.strip())
-            events.append(event)
-        except json.JSONDecodeError:
-            continue
+
+def iter_metric_events(
+    game_log_path: str,
+    game_id: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the events needed for metrics from a JSONL game log, one line at a time.
+
+    .jsonl.zst logs are decompressed on the fly. If game_id is given, only that
+    game's events are returned (for the shared events.jsonl log).
+    """
+    with open(game_log_path, 'rb') as f:
+        lines = f
+        if str(game_log_path).endswith(".zst"):
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read compressed game logs")
+            lines = io.BufferedReader(
+                zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+            )
+        for line in lines:
+            try:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if not isinstance(event, dict):
+                continue
+            if game_id is not None and event.get("game_id") != game_id:
+                continue
+            event_type = event.get("event")
+            if event_type in METRIC_EVENTS:
+                yield event
+            elif event_type == "DEBUG_agent_response":
+                # Only the timing is used; don't keep the raw response body
+                yield {
+                    "event": event_type,
+                    "agent_id": event.get("agent_id"),
+                    "response_time_ms": event.get("response_time_ms"),
+                }
+
+
+def extract_game_metrics(game_log_path: str, game_id: Optional[str] = None) -> Dict[str, Any]:
+    """Extract metrics from a game log file (only game_id's events, if given)."""
+    
+    # Stream the game log, keeping only the events the metrics use
+    events = list(iter_metric_events(game_log_path, game_id))
     
     # Find game creation event
     game_created = None
@@ -0,0 +1,299 @@
+"""Tests for GameLogger file persistence."""
+
+from datetime import datetime
+
+from app.logging.storage import GameLogger
+from app.types.agent import ActionType, AgentProfile, AgentRole, WerewolfAction
+from app.types.game import GamePhase, RoundRecord
+
+
+def test_events_round_trip_through_log_file(tmp_path, game_state_factory):
+    storage = GameLogger(log_dir=str(tmp_path))
+    state = game_state_factory()
+
+    storage.log_game_started(state.game_id)
+    storage.save_game(state, force_log=True)
+
+    log = storage.load_game_from_log(state.game_id)
+    assert log is not None
+    assert [event["event"] for event in log["events"]] == ["game_started", "game_update"]
+    assert log["events"][1]["alive"] == state.alive_agent_ids
+
+    storage.close()
+
+
+def test_close_game_releases_descriptor_and_reopens_on_write(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path))
+
+    storage.log_game_started("game-1")
+    storage.close_game("game-1")
+    assert "game-1" not in storage._fds
+
+    storage.log_game_ended("game-1", "villagers", 3)
+    assert "game-1" not in storage._fds
+    events = storage.load_game_from_log("game-1")["events"]
+    assert [event["event"] for event in events] == ["game_started", "game_ended"]
+
+    storage.close()
+
+
+def test_save_game_only_logs_when_state_changes(tmp_path, game_state_factory):
+    storage = GameLogger(log_dir=str(tmp_path))
+    state = game_state_factory()
+
+    storage.save_game(state)
+    storage.save_game(state)
+    state.alive_agent_ids.remove("agent_4")
+    state.eliminated_agent_ids.append("agent_4")
+    storage.save_game(state)
+
+    updates = storage.load_game_from_log(state.game_id)["events"]
+    assert len(updates) == 2
+    assert updates[1]["eliminated"] == ["agent_4"]
+
+    storage.close()
+
+
+def test_compressed_logs_round_trip(tmp_path, game_state_factory):
+    storage = GameLogger(log_dir=str(tmp_path), compress_logs=True)
+    state = game_state_factory()
+
+    storage.log_game_started(state.game_id)
+    storage.save_game(state, force_log=True)
+    storage.log_game_ended(state.game_id, "villagers", 1)
+
+    assert storage._get_log_path(state.game_id).name.endswith(".jsonl.zst")
+    events = storage.load_game_from_log(state.game_id)["events"]
+    assert [event["event"] for event in events] == ["game_started", "game_update", "game_ended"]
+
+    storage.close()
+
+
+def test_load_games_bulk_skips_missing_logs(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path))
+    for game_id in ("game-1", "game-2"):
+        storage.log_game_started(game_id)
+
+    games = storage.load_games_bulk(["game-1", "game-2", "missing"], max_workers=2)
+
+    assert set(games) == {"game-1", "game-2"}
+    assert games["game-2"]["events"][0]["event"] == "game_started"
+
+    storage.close()
+
+
+def test_save_action_records_investigation_result_from_passed_state(tmp_path, game_state_factory):
+    storage = GameLogger(log_dir=str(tmp_path))
+    state = game_state_factory(phase=GamePhase.NIGHT_SEER)
+    action = WerewolfAction(
+        agent_id="agent_2",
+        action_type=ActionType.INVESTIGATE,
+        target_agent_id="agent_0",
+        reasoning="check",
+        confidence=0.5,
+    )
+
+    # The state is never registered with save_game, so it must come from the caller
+    storage.save_action(state.game_id, action, state.round_number, state)
+
+    event = storage.load_game_from_log(state.game_id)["events"][0]
+    assert event["investigation_result"] == {"target_id": "agent_0", "is_werewolf": True}
+
+    storage.close()
+
+
+def test_flush_waits_for_queued_events(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path))
+    log_file = storage._get_log_path("game-1")
+
+    for round_number in range(500):
+        storage.log_agent_prompt("game-1", "agent_1", "day_discussion", round_number, "prompt")
+    assert storage.flush(timeout=5)
+    assert log_file.read_bytes().count(b"\n") == 500
+
+    storage.log_game_ended("game-1", "werewolves", 2)
+    assert log_file.read_bytes().count(b"\n") == 501
+
+    storage.close()
+    assert storage._writer_thread is None
+
+
+def test_flush_survives_write_errors_and_times_out_when_writer_is_stuck(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path), compress_logs=True)
+    compressor = storage._compressor
+
+    class _BrokenCompressor:
+        def compress(self, data):
+            raise RuntimeError("boom")
+
+    storage._compressor = _BrokenCompressor()
+    storage.log_game_started("game-1")
+    assert storage.flush(timeout=5)
+
+    # The writer thread is still alive and writes once compression works again
+    storage._compressor = compressor
+    storage.log_game_started("game-1")
+    assert storage.flush(timeout=5)
+    assert [event["event"] for event in storage.load_game_from_log("game-1")["events"]] == ["game_started"]
+
+    with storage._io_lock:
+        storage.log_game_started("game-1")
+        assert not storage.flush(timeout=0.1)
+
+    storage.close()
+
+
+def test_single_file_mode_splits_events_by_game(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path), single_file_mode=True)
+
+    storage.log_game_started("game-1")
+    storage.log_game_started("game-2")
+    storage.log_game_ended("game-1", "villagers", 3)
+
+    assert [path.name for path in storage.log_dir.iterdir()] == ["events.jsonl"]
+    events = storage.load_game_from_log("game-1")["events"]
+    assert [event["event"] for event in events] == ["game_started", "game_ended"]
+
+    games = storage.load_games_bulk(["game-1", "game-2", "game-3"])
+    assert sorted(games) == ["game-1", "game-2"]
+    assert len(games["game-2"]["events"]) == 1
+
+    storage.close()
+
+
+def test_action_detail_serializes_nested_datetimes_and_enums(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path))
+    parsed_action = {
+        "action_type": ActionType.VOTE,
+        "votes": [{"target": "agent_2", "at": datetime(2024, 1, 1, 12, 30)}]
+    }
+
+    storage.log_agent_action_detail("game-1", "agent_1", "prompt", "response", parsed_action)
+
+    event = storage.load_game_from_log("game-1")["events"][0]
+    assert event["parsed_action"] == {
+        "action_type": "vote",
+        "votes": [{"target": "agent_2", "at": "2024-01-01T12:30:00"}]
+    }
+
+    storage.close()
+
+
+def test_save_agents_logs_agent_profiles(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path))
+    agents = [
+        AgentProfile(agent_id="agent_1", agent_url="http://localhost:9001", name="Agent 1",
+                     role=AgentRole.SEER, model="gemini-2.5-flash"),
+        AgentProfile(agent_id="agent_2", agent_url="http://localhost:9002", name="Agent 2")
+    ]
+
+    storage.save_agents("game-1", agents)
+
+    event = storage.load_game_from_log("game-1")["events"][0]
+    assert event["agents"] == [
+        {"id": "agent_1", "name": "Agent 1", "url": "http://localhost:9001/",
+         "role": "seer", "model": "gemini-2.5-flash"},
+        {"id": "agent_2", "name": "Agent 2", "url": "http://localhost:9002/",
+         "role": None, "model": None}
+    ]
+
+    storage.close()
+
+
+def test_debug_getters_reuse_index_until_next_event(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path))
+    storage.log_agent_prompt("game-1", "agent_1", "day_discussion", 1, "prompt one")
+    storage.log_agent_prompt("game-1", "agent_2", "day_discussion", 1, "prompt two")
+
+    assert [p["prompt"] for p in storage.get_agent_prompts("game-1", "agent_1")] == ["prompt one"]
+    assert len(storage.get_agent_prompts("game-1")) == 2
+    assert "game-1" in storage._log_indexes
+
+    storage.log_agent_prompt("game-1", "agent_1", "day_voting", 1, "prompt three")
+    assert "game-1" not in storage._log_indexes
+    assert len(storage.get_agent_prompts("game-1", "agent_1")) == 2
+
+    storage.close()
+
+
+def test_debug_index_is_not_cached_if_an_event_lands_while_reading(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path))
+    storage.log_agent_prompt("game-1", "agent_1", "day_discussion", 1, "prompt one")
+    original_load = storage.load_game_from_log
+
+    def load_then_log(game_id):
+        game_log = original_load(game_id)
+        # Another thread logs an event after the file was read
+        storage.log_agent_prompt("game-1", "agent_1", "day_voting", 1, "prompt two")
+        return game_log
+
+    storage.load_game_from_log = load_then_log
+    assert len(storage.get_agent_prompts("game-1", "agent_1")) == 1
+    assert "game-1" not in storage._log_indexes
+
+    storage.load_game_from_log = original_load
+    assert len(storage.get_agent_prompts("game-1", "agent_1")) == 2
+
+    storage.close()
+
+
+def test_discussion_metrics_count_seer_eliminated_after_reveal(tmp_path, game_state_factory):
+    storage = GameLogger(log_dir=str(tmp_path))
+    state = game_state_factory(
+        alive_agents=["agent_0", "agent_1", "agent_3", "agent_4"],
+        eliminated_agents=["agent_2"],
+        round_number=3
+    )
+    state.round_history = [
+        RoundRecord(round_number=1, phase=GamePhase.DAY_VOTING),
+        RoundRecord(round_number=2, phase=GamePhase.NIGHT_WEREWOLF, eliminated_agents=["agent_2"])
+    ]
+    state.metadata["investigation_reveals"] = [
+        {"seer_id": "agent_2", "round": 1, "revealed_investigations": [
+            {"target_id": "agent_0", "is_werewolf": True}
+        ]},
+        {"seer_id": "agent_2", "round": 0, "revealed_investigations": []}
+    ]
+
+    metrics = storage._calculate_discussion_metrics(state)
+
+    assert metrics["seer_reveals_per_game"] == 2
+    assert metrics["first_seer_reveal_round"] == 0
+    assert metrics["unmasked_wolf_percentage"] == 0
+    assert metrics["backfired_percentage"] == 50.0
+
+
+def test_game_summaries_are_cached_until_the_game_is_saved(tmp_path, game_state_factory):
+    storage = GameLogger(log_dir=str(tmp_path))
+    state = game_state_factory()
+    storage.save_game(state)
+
+    summaries = storage.get_all_summaries()
+    assert [summary["game_id"] for summary in summaries] == [state.game_id]
+    assert storage._all_summaries_version == storage.summaries_version
+
+    # Callers get copies; editing one must not leak into the cache
+    summaries[0]["round_number"] = 99
+    storage.get_game_summary(state.game_id)["status"] = "edited"
+    assert storage.get_all_summaries()[0]["round_number"] == 1
+    assert storage.get_game_summary(state.game_id)["status"] == state.status.value
+
+    state.round_number = 2
+    assert storage.get_game_summary(state.game_id)["round_number"] == 1
+    storage.save_game(state)
+    assert storage.get_all_summaries()[0]["round_number"] == 2
+
+    storage.close()
+
+
+def test_unserializable_event_values_are_rejected_not_stringified(tmp_path):
+    storage = GameLogger(log_dir=str(tmp_path))
+
+    storage._write_game_event("game-1", {"event": "custom", "game_id": "game-1", "value": object()})
+    storage._write_game_event("game-1", {"event": "tags", "game_id": "game-1", "value": {"a"}})
+
+    events = storage.load_game_from_log("game-1")["events"]
+    assert [event["event"] for event in events] == ["tags"]
+    assert events[0]["value"] == ["a"]
+
+    storage.close()
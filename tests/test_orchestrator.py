@@ -0,0 +1,176 @@
+"""Tests for GameOrchestrator request handling and per-game helpers."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.logging.storage import GameLogger
+from app.orchestrator import PHASE_ACTION_WINDOW, GameOrchestrator
+from app.types.agent import ActionType, AgentProfile, AgentRole, WerewolfAction
+from app.types.game import GameConfig, GamePhase, GameStatus
+
+
+class _SlowClient:
+    """A2A client stand-in that takes a fixed time and tracks concurrent calls."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_message(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        part = SimpleNamespace(text="not a valid response")
+        return SimpleNamespace(root=SimpleNamespace(error=None, result=SimpleNamespace(parts=[part])))
+
+
+@pytest.mark.asyncio
+async def test_request_semaphore_caps_concurrency_and_excludes_wait_from_response_time(
+    tmp_path, game_state_factory
+):
+    storage = GameLogger(log_dir=str(tmp_path))
+    orchestrator = GameOrchestrator(storage, prewarm_connections=False)
+    state = game_state_factory()
+    storage.save_game(state)
+
+    client = _SlowClient(delay=0.1)
+    agents = [
+        AgentProfile(agent_id=agent_id, agent_url=f"http://agent{i}.test", name=agent_id,
+                     role=AgentRole(state.role_assignments[agent_id]))
+        for i, agent_id in enumerate(state.agent_ids[:3])
+    ]
+    for agent in agents:
+        orchestrator.agent_clients[(state.game_id, agent.agent_id)] = client
+    orchestrator.request_semaphores[state.game_id] = asyncio.Semaphore(1)
+
+    response_times = []
+    original_log_response = storage.log_agent_response
+
+    def record_response(**kwargs):
+        response_times.append(kwargs["response_time_ms"])
+        original_log_response(**kwargs)
+
+    storage.log_agent_response = record_response
+
+    await asyncio.gather(*(
+        orchestrator._request_agent_action(state.game_id, agent, state) for agent in agents
+    ))
+
+    assert client.max_in_flight == 1
+    assert len(response_times) == 3
+    # Queued requests waited up to 200 ms for the slot; only the 100 ms call counts
+    assert all(time_ms < 180 for time_ms in response_times)
+
+    await orchestrator.close()
+    storage.close()
+
+
+def test_phase_actions_use_acceptance_time_not_agent_timestamp(tmp_path, game_state_factory):
+    storage = GameLogger(log_dir=str(tmp_path))
+    orchestrator = GameOrchestrator(storage, prewarm_connections=False)
+    state = game_state_factory(phase=GamePhase.DAY_DISCUSSION)
+    storage.save_game(state)
+
+    # Accepted before this phase's window
+    previous = WerewolfAction(
+        agent_id="agent_0",
+        action_type=ActionType.PASS,
+        reasoning="test",
+        confidence=0.5,
+        timestamp=datetime.utcnow() - PHASE_ACTION_WINDOW - timedelta(seconds=1),
+    )
+    storage.save_action(state.game_id, previous, state.round_number, state)
+
+    # Agent-supplied timestamp far in the past must not hide the action
+    current = WerewolfAction(
+        agent_id="agent_1",
+        action_type=ActionType.PASS,
+        reasoning="test",
+        confidence=0.5,
+        timestamp=datetime(2000, 1, 1),
+    )
+    orchestrator._process_action(state.game_id, current)
+
+    assert orchestrator._get_phase_actions(state.game_id) == [current]
+
+    storage.close()
+
+
+@pytest.mark.asyncio
+async def test_finalize_game_writes_terminal_events_and_releases_game(tmp_path, game_state_factory):
+    storage = GameLogger(log_dir=str(tmp_path))
+    orchestrator = GameOrchestrator(storage, prewarm_connections=False)
+    state = game_state_factory(status=GameStatus.COMPLETED, phase=GamePhase.GAME_OVER)
+    storage.save_game(state)
+    orchestrator.request_semaphores[state.game_id] = asyncio.Semaphore(1)
+
+    await orchestrator._finalize_game(state.game_id)
+
+    assert state.game_id not in orchestrator.request_semaphores
+    assert state.game_id not in storage._fds
+    events = storage.load_game_from_log(state.game_id)["events"]
+    assert [event["event"] for event in events[-3:]] == ["game_completed", "game_ended", "evaluation_metrics"]
+    # Timestamps are handed to the logger as datetimes and encoded there
+    assert datetime.fromisoformat(events[-1]["timestamp"])
+
+    storage.close()
+
+
+@pytest.mark.asyncio
+async def test_games_with_the_same_seed_make_the_same_random_choices(tmp_path, monkeypatch):
+    storage = GameLogger(log_dir=str(tmp_path))
+    orchestrator = GameOrchestrator(storage, prewarm_connections=False)
+
+    async def no_game_loop(self, game_id, agent_urls=None):
+        return None
+
+    monkeypatch.setattr(GameOrchestrator, "_run_game_loop", no_game_loop)
+    agent_urls = [f"http://agent{i}.test" for i in range(8)]
+
+    outcomes = []
+    for _ in range(2):
+        game_id = await orchestrator.start_game(agent_urls, GameConfig(seed=7))
+        state = storage.get_game(game_id)
+        state.phase = GamePhase.DAY_VOTING
+        orchestrator._create_fallback_action(game_id, "agent_0", state, "invalid vote")
+        fallback = storage.get_game_actions(game_id)[-1]
+        assert fallback.action_type == ActionType.VOTE
+        outcomes.append((
+            state.role_assignments,
+            orchestrator.werewolf_decision_makers[game_id],
+            fallback.target_agent_id,
+        ))
+
+    assert outcomes[0] == outcomes[1]
+
+    await orchestrator.close()
+    storage.close()
+
+
+@pytest.mark.asyncio
+async def test_releasing_a_game_keeps_clients_of_concurrent_games(tmp_path, monkeypatch):
+    storage = GameLogger(log_dir=str(tmp_path))
+    orchestrator = GameOrchestrator(storage, prewarm_connections=False)
+
+    async def no_game_loop(self, game_id, agent_urls=None):
+        return None
+
+    monkeypatch.setattr(GameOrchestrator, "_run_game_loop", no_game_loop)
+    agent_urls = [f"http://agent{i}.test" for i in range(8)]
+    first = await orchestrator.start_game(agent_urls, GameConfig())
+    second = await orchestrator.start_game(agent_urls, GameConfig())
+
+    await orchestrator._release_game(first)
+
+    assert not any(game_id == first for game_id, _ in orchestrator.agent_clients)
+    assert all((second, f"agent_{i}") in orchestrator.agent_clients for i in range(8))
+
+    await orchestrator.close()
+    storage.close()
@@ -16,7 +16,7 @@ async def test_orchestrator_runs_full_round_and_logs(tmp_path, monkeypatch):
     """Run a full day cycle and assert log output captures actions."""
 
     # Force deterministic role assignment for reproducibility
-    def fake_assign_roles(agent_ids, config_dict):
+    def fake_assign_roles(agent_ids, config_dict, rng=None):
         roles = {agent_ids[0]: "werewolf"}
         for agent_id in agent_ids[1:]:
             roles[agent_id] = "villager"
@@ -0,0 +1,58 @@
+"""Tests for the shared public game memory."""
+
+from app.memory.public_memory import PublicGameMemory
+
+
+def _memory_with_one_round() -> PublicGameMemory:
+    memory = PublicGameMemory("game-1")
+    memory.start_phase(1, "day_discussion", ["agent_0", "agent_1", "agent_2"])
+    memory.add_discussion("agent_0", "agent_1 is lying", 1, "accuse", ["agent_1"])
+    memory.add_discussion("agent_1", "I am the seer", 1, "claim_role")
+    memory.add_vote("agent_0", "agent_1", 1)
+    memory.add_vote("agent_2", "agent_1", 1)
+    memory.add_elimination("agent_1", 1, "vote", "day_voting")
+    memory.update_alive_agents(1, ["agent_0", "agent_2"])
+    return memory
+
+
+def test_discussions_are_returned_in_insertion_order():
+    memory = _memory_with_one_round()
+
+    assert memory.get_round_discussions(1) == [
+        {"agent_id": "agent_0", "content": "agent_1 is lying",
+         "discussion_type": "accuse", "targets": ["agent_1"]},
+        {"agent_id": "agent_1", "content": "I am the seer",
+         "discussion_type": "claim_role", "targets": []},
+    ]
+    assert memory.get_round_discussions(2) == []
+
+
+def test_to_dict_round_trips_through_from_dict():
+    memory = _memory_with_one_round()
+
+    restored = PublicGameMemory.from_dict(memory.to_dict())
+
+    assert restored.get_all_discussions() == memory.get_all_discussions()
+    assert restored.get_compact_summary() == memory.get_compact_summary()
+
+
+def test_compact_summary_is_cached_until_memory_changes():
+    memory = _memory_with_one_round()
+
+    summary = memory.get_compact_summary()
+    assert memory.get_compact_summary() is summary
+
+    memory.add_vote("agent_0", "agent_2", 2)
+    updated = memory.get_compact_summary()
+    assert updated != summary
+    assert "ROUND 2:\n  Votes:\n    agent_0 -> agent_2" in updated
+
+
+def test_to_dict_is_reused_until_memory_changes():
+    memory = _memory_with_one_round()
+
+    snapshot = memory.to_dict()
+    assert memory.to_dict() is snapshot
+
+    memory.add_discussion("agent_2", "agent_0 seems fine", 2)
+    assert len(memory.to_dict()["discussions"]) == 3
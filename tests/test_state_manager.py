@@ -33,6 +33,16 @@ def test_assign_roles_respects_configuration():
     assert role_counts["villager"] == len(agent_ids) - 5
 
 
+def test_assign_roles_is_reproducible_with_seeded_rng():
+    agent_ids = [f"agent_{i}" for i in range(8)]
+    config = GameConfig(has_hunter=True, has_witch=True).model_dump()
+
+    first = StateManager.assign_roles(agent_ids, config, random.Random(42))
+    second = StateManager.assign_roles(agent_ids, config, random.Random(42))
+
+    assert first == second
+
+
 def test_get_next_phase_cycles_through_enabled_roles():
     config = GameConfig()
 
@@ -74,6 +84,23 @@ def test_process_voting_results_returns_majority(monkeypatch, game_state_factory
     assert eliminated == "agent_4"
 
 
+def test_process_voting_results_breaks_ties_with_seeded_rng(game_state_factory):
+    state = game_state_factory()
+    state.current_votes = {
+        "agent_0": "agent_2",
+        "agent_1": "agent_3",
+        "agent_2": "agent_4",
+        "agent_3": "agent_5",
+    }
+
+    first_rng, second_rng = random.Random(7), random.Random(7)
+    first = [StateManager.process_voting_results(state, first_rng) for _ in range(10)]
+    second = [StateManager.process_voting_results(state, second_rng) for _ in range(10)]
+
+    assert first == second
+    assert set(first) <= {"agent_2", "agent_3", "agent_4", "agent_5"}
+
+
 def test_process_werewolf_kill_requires_majority(game_state_factory):
     state = game_state_factory(phase=GamePhase.NIGHT_WEREWOLF)
 
@@ -5,7 +5,6 @@ print("[1] Starting white_agent/main.py imports", file=sys.stderr, flush=True)
 
 import os
 import logging
-import json
 import tomllib
 import time
 from typing import Optional, Dict, Any
@@ -18,9 +17,9 @@ print("[3] uvicorn imported", file=sys.stderr, flush=True)
 from dotenv import load_dotenv
 print("[4] dotenv imported", file=sys.stderr, flush=True)
 
-print("[5] about to import a2a.server.apps", file=sys.stderr, flush=True)
-from a2a.server.apps import A2AStarletteApplication
-print("[6] A2AStarletteApplication imported", file=sys.stderr, flush=True)
+print("[5] about to import app.a2a_utils", file=sys.stderr, flush=True)
+from app.a2a_utils import CachedAgentCardApplication, dumps_text, parse_task_data
+print("[6] A2A server helpers imported", file=sys.stderr, flush=True)
 
 from a2a.server.request_handlers import DefaultRequestHandler
 print("[7] DefaultRequestHandler imported", file=sys.stderr, flush=True)
@@ -85,26 +84,11 @@ class WerewolfWhiteAgentExecutor(AgentExecutor):
         global llm_handler
 
         # Parse the incoming message
-        user_message = context.message
-        task_data = None
-
-        for part in user_message.parts:
-            if hasattr(part, 'root') and hasattr(part.root, 'text'):
-                text = part.root.text
-            elif hasattr(part, 'text'):
-                text = part.text
-            else:
-                continue
-
-            try:
-                task_data = json.loads(text)
-                break
-            except json.JSONDecodeError:
-                continue
+        task_data = parse_task_data(context.message.parts)
 
         if not task_data:
             error_response = {"error": "Failed to parse task data from Green Agent"}
-            response_message = new_agent_text_message(json.dumps(error_response))
+            response_message = new_agent_text_message(dumps_text(error_response))
             await event_queue.enqueue_event(response_message)
             return
 
@@ -117,12 +101,12 @@ class WerewolfWhiteAgentExecutor(AgentExecutor):
                 result = {"error": f"Unknown task: {task_name}"}
 
             # Send response
-            response_message = new_agent_text_message(json.dumps(result))
+            response_message = new_agent_text_message(dumps_text(result))
             await event_queue.enqueue_event(response_message)
 
         except Exception as e:
             logger.error(f"Error executing task: {e}", exc_info=True)
-            error_message = new_agent_text_message(json.dumps({"error": str(e)}))
+            error_message = new_agent_text_message(dumps_text({"error": str(e)}))
             await event_queue.enqueue_event(error_message)
 
     async def _handle_werewolf_action(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -267,13 +251,22 @@ def start_white_agent(agent_name: str = "white_agent_card", host: str = "localho
 
     # Create A2A application
     agent_card = AgentCard(**agent_card_dict)
-    a2a_app = A2AStarletteApplication(
+    a2a_app = CachedAgentCardApplication(
         agent_card=agent_card,
         http_handler=request_handler,
     )
 
     # Run the server
-    uvicorn.run(a2a_app.build(), host=host, port=port)
+    uvicorn.run(
+        a2a_app.build(),
+        host=host,
+        port=port,
+        # Require the C event loop and HTTP parser (uvicorn[standard]) instead of
+        # silently falling back to asyncio/h11; uvloop has no Windows build
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        access_log=False,
+    )
 
 
 if __name__ == "__main__":